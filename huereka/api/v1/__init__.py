@@ -4,8 +4,8 @@ import os
 
 from flask import Blueprint
 
+from huereka.common import flask_utils
 from huereka.common import import_utils
-from huereka.shared import responses
 
 api = Blueprint("v1_api", __name__)
 
@@ -13,7 +13,7 @@ api = Blueprint("v1_api", __name__)
 @api.route("/health", methods=["GET"])
 def health() -> tuple:
     """Basic health check to ensure API version is responding."""
-    return responses.ok()
+    return flask_utils.ok()
 
 
 # Load all routes on initialization to populate the layouts and callbacks.
@@ -1,61 +1,19 @@
 """Routes for /schedules collection."""
 
-import logging
-
-from flask import request
-
 from huereka.api.v1 import api
-from huereka.common.lighting_schedule import LightingSchedule
+from huereka.common import flask_utils
 from huereka.common.lighting_schedule import LightingSchedules
-from huereka.shared import responses
-
-logger = logging.getLogger(__name__)
-
-
-@api.route("/schedules", methods=["GET"])
-def schedules_get() -> tuple:
-    """Find all currently saved lighting schedules."""
-    schedules = LightingSchedules.to_json()
-    response = {
-        "item_count": len(schedules),
-        "items": schedules,
-    }
-    return responses.ok(response)
+from huereka.common.lighting_schedule import wake_schedule_watchdog
 
 
-@api.route("/schedules", methods=["POST"])
-def schedules_post() -> tuple:
-    """Create a new lighting schedule."""
-    body = request.get_json(force=True)
-    schedule = LightingSchedule.from_json(body)
-    LightingSchedules.register(schedule)
-    LightingSchedules.save()
-    response = {
-        "item_count": 1,
-        "items": schedule.to_json(),
-    }
-    return responses.ok(response)
-
-
-@api.route("/schedules/<string:uuid>", methods=["DELETE"])
-def schedules_delete_entry(uuid: str) -> tuple:
-    """Remove a lighting schedule."""
-    schedule = LightingSchedules.remove(uuid)
-    LightingSchedules.save()
-    return responses.ok(schedule.to_json())
+def _on_update(unused_changed: set[str]) -> None:
+    """Re-apply schedules immediately when a schedule changes."""
+    LightingSchedules.verify_active_schedules(force=True)
 
 
-@api.route("/schedules/<string:uuid>", methods=["GET"])
-def schedules_get_entry(uuid: str) -> tuple:
-    """Find a lighting schedule."""
-    return responses.ok(LightingSchedules.get(uuid).to_json())
+def _on_create() -> None:
+    """Check schedules for a new schedule without waiting for the next watchdog check."""
+    wake_schedule_watchdog()
 
 
-@api.route("/schedules/<string:uuid>", methods=["PUT"])
-def schedules_put_entry(uuid: str) -> tuple:
-    """Update a lighting schedule's configuration."""
-    body = request.get_json(force=True)
-    schedule = LightingSchedules.update(uuid, body)
-    LightingSchedules.save()
-    LightingSchedules.verify_active_schedules(force=True)
-    return responses.ok(schedule)
+flask_utils.add_collection_routes(api, "schedules", LightingSchedules, on_update=_on_update, on_create=_on_create)
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-import threading
 from typing import Any
 
 from huereka.common import color_utils
 from huereka.shared.collections import KEY_ID
 from huereka.shared.collections import Collection
 from huereka.shared.collections import CollectionEntry
+from huereka.shared.collections import CollectionRWLock
 from huereka.shared.collections import CollectionValueError
 
 logger = logging.getLogger(__name__)
@@ -27,10 +27,22 @@ MODE_RANDOM = 4
 DEFAULT_PROFILE_OFF = "off"
 DEFAULT_GAMMA_CORRECTION = 1.0
 
+# Gamma corrected values, by gamma correction, shared across profiles to prevent recalculating identical tables.
+# A gamma of 1.0 does not change the values, and is the default, so it is always available without calculation.
+_gamma_tables: dict[float, tuple[int, ...]] = {1.0: tuple(range(256))}
+
 
 class ColorProfile(CollectionEntry):
     """Color profile used to control LED strip."""
 
+    __slots__ = (
+        "_colors",
+        "_corrected_colors",
+        "_gamma_correction",
+        "_gamma_values",
+        "_mode",
+    )
+
     def __init__(
         self,
         name: str,
@@ -51,26 +63,23 @@ class ColorProfile(CollectionEntry):
                 Can be combined via bitwise operations. e.g. MODE_REPEAT | MODE_MIRROR == MODE_REPEAT AND MODE_MIRROR
         """
         super().__init__(uuid=uuid, name=name)
-        self._corrected_colors = tuple()
+        # Corrected colors are calculated on first use, and cleared whenever the colors or gamma change.
+        self._corrected_colors = None
         self._mode = mode
-
-        # Set the current colors, and set a blank corrected colors value so first gamma application updates.
-        self.colors = [color_utils.parse_color(color) for color in colors or []]
-        self._last_corrected_colors = []
-
-        # Update gamma values last so that correct colors are calculated on first application.
+        self._colors = [color_utils.parse_color(color) for color in colors or []]
         self._gamma_values = tuple()
         self._gamma_correction = 0.0
         self.gamma_correction = gamma_correction
 
     def __eq__(self, other: Any) -> bool:
         """Make the profile comparable for equality using unique attributes."""
-        return (
+        # Compare the single values first, so that the colors are only compared when everything else matches.
+        return self is other or (
             isinstance(other, ColorProfile)
             and self.name == other.name
-            and self.gamma_correction == other.gamma_correction
-            and self.colors == other.colors
+            and self._gamma_correction == other._gamma_correction
             and self._mode == other._mode
+            and self._colors == other._colors
         )
 
     def _set_mode(self, mode: int) -> None:
@@ -90,7 +99,7 @@ class ColorProfile(CollectionEntry):
         return ColorProfile(
             name=self.name,
             uuid=self.uuid,
-            colors=self.colors.copy(),
+            colors=self._colors,
             gamma_correction=self.gamma_correction,
             mode=self._mode,
         )
@@ -136,17 +145,39 @@ class ColorProfile(CollectionEntry):
             mode=mode,
         )
 
+    @property
+    def colors(self) -> list[color_utils.Color]:
+        """Copy of the current colors, before gamma correction. Replace the colors to update the corrected colors."""
+        return list(self._colors)
+
+    @colors.setter
+    def colors(self, colors: list[color_utils.Color]) -> None:
+        """Update the colors, and clear the corrected colors if they changed."""
+        if colors != self._colors:
+            self._corrected_colors = None
+        # Store a copy, so that later changes to the original list cannot leave the corrected colors outdated.
+        self._colors = list(colors)
+
     @property
     def corrected_colors(self) -> tuple:
         """The current gamma corrected colors."""
-        if self._last_corrected_colors != self.colors:
+        if self._corrected_colors is None:
+            colors = self._colors
+            if self._gamma_correction == 1.0 and min(colors, default=0) >= 0 and max(colors, default=0) <= 0xFFFFFF:
+                # Gamma of 1.0 does not change the values, reuse the colors when they are already valid RGB values.
+                self._corrected_colors = tuple(colors)
+                return self._corrected_colors
+            # Look up each portion directly from the packed color, to skip the per portion property calls.
+            gamma_values = self._gamma_values
+            color_cls = color_utils.Color
             self._corrected_colors = tuple(
-                color_utils.Color.from_rgb(
-                    self.gamma_values[color.red], self.gamma_values[color.green], self.gamma_values[color.blue]
+                color_cls(
+                    (gamma_values[(color >> 16) & 0xFF] << 16)
+                    | (gamma_values[(color >> 8) & 0xFF] << 8)
+                    | gamma_values[color & 0xFF]
                 )
-                for color in self.colors
+                for color in colors
             )
-            self._last_corrected_colors = self.colors.copy()
         return self._corrected_colors
 
     @property
@@ -159,12 +190,21 @@ class ColorProfile(CollectionEntry):
         """Update the gamma correction base value and individual corrected values."""
         new_value = round(value, 2)
         if new_value != self._gamma_correction:
-            self._gamma_correction = round(value, 2)
-            max_input = 255
-            max_output = 255
-            self._gamma_values = tuple(
-                int(pow(i / max_input, self._gamma_correction) * max_output + 0.5) for i in range(max_input + 1)
-            )
+            self._gamma_correction = new_value
+            gamma_values = _gamma_tables.get(new_value)
+            if gamma_values is None:
+                max_input = 255
+                max_output = 255
+                if new_value == 2.0:
+                    # Squares can be rounded with integer math, producing the same values without floating point.
+                    gamma_values = tuple((i * i + 127) // 255 for i in range(max_input + 1))
+                else:
+                    gamma_values = tuple(
+                        int(pow(i / max_input, new_value) * max_output + 0.5) for i in range(max_input + 1)
+                    )
+                _gamma_tables[new_value] = gamma_values
+            self._gamma_values = gamma_values
+            self._corrected_colors = None
 
     @property
     def gamma_values(self) -> tuple:
@@ -219,7 +259,7 @@ class ColorProfile(CollectionEntry):
         return {
             KEY_ID: self.uuid,
             KEY_NAME: self.name,
-            KEY_COLORS: [color.to_rgb() for color in self.colors],
+            KEY_COLORS: [color.to_rgb() for color in self._colors],
             KEY_GAMMA: self._gamma_correction,
             KEY_MODE: self._mode,
         }
@@ -229,7 +269,7 @@ class ColorProfiles(Collection):
     """Singleton for managing reusable color profiles."""
 
     _collection: dict[str, ColorProfile] = {}
-    _collection_lock: threading.Condition = threading.Condition()
+    _collection_lock: CollectionRWLock = CollectionRWLock()
     _collection_uri: str = None
 
     collection_help: str = "color profiles"
@@ -250,11 +290,11 @@ class ColorProfiles(Collection):
         cls.register(ColorProfile(DEFAULT_PROFILE_OFF, uuid=DEFAULT_PROFILE_OFF, colors=[]))
 
     @classmethod
-    def update(
+    def update(  # Each value is validated and compared individually. pylint: disable=too-many-branches
         cls,
         uuid: str,
         new_values: dict,
-    ) -> dict:
+    ) -> tuple[dict, set[str]]:
         """Update the values of a color profile.
 
         Args:
@@ -262,9 +302,11 @@ class ColorProfiles(Collection):
             new_values: New JSON like attributes to set on the profile.
 
         Returns:
-            Final profile configuration with the updated values.
+            Final profile configuration with the updated values, and the keys of the values that changed.
         """
+        changed = set()
         with cls._collection_lock:
+            cls._collection_json = None
             profile = cls.get(uuid)
             name = new_values.get(KEY_NAME)
             if name is not None:
@@ -273,36 +315,44 @@ class ColorProfiles(Collection):
                 original_name = profile.name
                 profile.name = name
                 cls._collection[name] = cls._collection.pop(original_name)
+                if name != original_name:
+                    changed.add(KEY_NAME)
             colors = new_values.get(KEY_COLORS)
             if colors is not None:
                 if not isinstance(colors, list):
                     raise CollectionValueError("invalid-color_profile-colors")
                 try:
-                    profile.colors = [color_utils.parse_color(color) for color in colors]
+                    colors = [color_utils.parse_color(color) for color in colors]
                 except Exception as error:  # pylint: disable=broad-except
                     raise CollectionValueError("invalid-color_profile-colors") from error
+                if colors != profile.colors:
+                    profile.colors = colors
+                    changed.add(KEY_COLORS)
             gamma_correction = new_values.get(KEY_GAMMA)
             if gamma_correction is not None:
                 if not isinstance(gamma_correction, float):
                     raise CollectionValueError("invalid-color_profile-gamma")
-                profile.gamma_correction = gamma_correction
+                if gamma_correction != profile.gamma_correction:
+                    profile.gamma_correction = gamma_correction
+                    changed.add(KEY_GAMMA)
             mode = new_values.get(KEY_MODE)
             if mode is not None:
                 if not isinstance(mode, int):
                     raise CollectionValueError("invalid-color_profile-mode")
-                if mode == MODE_NONE:
-                    profile.mode = MODE_NONE
-                else:
-                    profile.repeat = mode & MODE_REPEAT != 0
-                    profile.mirror = mode & MODE_MIRROR != 0
-                    profile.random = mode & MODE_RANDOM != 0
+                original_mode = (profile.repeat, profile.mirror, profile.random)
+                # MODE_NONE clears all pattern flags.
+                profile.repeat = mode & MODE_REPEAT != 0
+                profile.mirror = mode & MODE_MIRROR != 0
+                profile.random = mode & MODE_RANDOM != 0
+                if (profile.repeat, profile.mirror, profile.random) != original_mode:
+                    changed.add(KEY_MODE)
             result = profile.to_json()
-        return result
+        return result, changed
 
     @classmethod
-    def validate_entry(cls, data: dict, index: int) -> bool:
+    def validate_entry(cls, data: dict, index: int, pending: dict[str, ColorProfile] | None = None) -> bool:
         """Additional confirmation of entry values before load."""
-        if not super().validate_entry(data, index):
+        if not super().validate_entry(data, index, pending=pending):
             return False
         name = data.get(KEY_NAME)
         if name == DEFAULT_PROFILE_OFF:
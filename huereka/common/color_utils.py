@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 import random
 from enum import Enum
+from functools import lru_cache
 from typing import Iterable
 
 
@@ -29,9 +30,7 @@ class Color(int):
         Returns:
             New RGB color with the lightness applied.
         """
-        hsl = HSLColor.from_color(self)
-        hsl_dark = hsl.with_lightness(max(0.0, min(hsl.lightness - amount, 1.0)))
-        return hsl_dark.to_color()
+        return _adjust_lightness(self, -amount)
 
     @staticmethod
     def from_rgb(red: int, green: int, blue: int) -> Color:
@@ -66,9 +65,7 @@ class Color(int):
         Returns:
             New RGB color with the lightness applied.
         """
-        hsl = HSLColor.from_color(self)
-        hsl_light = hsl.with_lightness(max(0.0, min(hsl.lightness + amount, 1.0)))
-        return hsl_light.to_color()
+        return _adjust_lightness(self, amount)
 
     @property
     def red(self) -> int:
@@ -85,7 +82,7 @@ class Color(int):
         Returns:
             Hex string representing color.
         """
-        return f"#{self.red:02x}{self.green:02x}{self.blue:02x}"
+        return _rgb_hex(self)
 
 
 class Colors(Enum):
@@ -104,6 +101,8 @@ class Colors(Enum):
 class HSLColor:
     """Color extension to calculate Hue, Saturation, and Lightness from RGB colors."""
 
+    __slots__ = ("hue", "lightness", "saturation")
+
     def __init__(self, hue: float, saturation: float, lightness: float) -> None:
         """Set up the color extension based on HSL values.
 
@@ -126,9 +125,9 @@ class HSLColor:
         Returns:
             RGB value converted into HSL values.
         """
-        red = color.red / 0xFF
-        green = color.green / 0xFF
-        blue = color.blue / 0xFF
+        red = ((color >> 16) & 0xFF) / 0xFF
+        green = ((color >> 8) & 0xFF) / 0xFF
+        blue = (color & 0xFF) / 0xFF
 
         max_rgb = max(red, green, blue)
         min_rgb = min(red, green, blue)
@@ -136,7 +135,8 @@ class HSLColor:
 
         hue = rgb_to_hue(red, green, blue, max_rgb, delta)
         lightness = (max_rgb + min_rgb) / 2.0
-        saturation = 0.0 if lightness == 1.0 else max(0.0, min(delta / (1.0 - abs(2.0 * lightness - 1.0)), 1.0))
+        # Greys, including black and white, have no saturation.
+        saturation = 0.0 if delta == 0.0 else max(0.0, min(delta / (1.0 - abs(2.0 * lightness - 1.0)), 1.0))
         return HSLColor(hue, saturation, lightness)
 
     def to_color(self) -> Color:
@@ -162,6 +162,48 @@ class HSLColor:
         return HSLColor(self.hue, self.saturation, lightness)
 
 
+def _adjust_lightness(color: int, amount: float) -> Color:
+    """Change a color's lightness while maintaining RGB ratio.
+
+    Equivalent to converting to HSL, replacing the lightness, and converting back, without the intermediate objects.
+
+    Args:
+        color: Original color as RGB combined value.
+        amount: Percentage to add to the lightness. Negative values darken the color.
+
+    Returns:
+        New RGB color with the lightness applied.
+    """
+    red = ((color >> 16) & 0xFF) / 0xFF
+    green = ((color >> 8) & 0xFF) / 0xFF
+    blue = (color & 0xFF) / 0xFF
+
+    max_rgb = max(red, green, blue)
+    min_rgb = min(red, green, blue)
+    delta = max_rgb - min_rgb
+
+    hue = rgb_to_hue(red, green, blue, max_rgb, delta)
+    lightness = (max_rgb + min_rgb) / 2.0
+    saturation = 0.0 if delta == 0.0 else max(0.0, min(delta / (1.0 - abs(2.0 * lightness - 1.0)), 1.0))
+
+    lightness = max(0.0, min(lightness + amount, 1.0))
+    chroma = (1.0 - abs(2.0 * lightness - 1.0)) * saturation
+    secondary = chroma * (1.0 - abs(((hue / 60.0) % 2.0) - 1.0))
+    return hue_to_rgb(hue, chroma, secondary, lightness - chroma / 2.0)
+
+
+@lru_cache(maxsize=256)
+def _parse_color_str(value: str) -> Color:
+    """Translate a string numerical value into a color. Cached, palettes commonly reuse the same colors."""
+    return Color(value.replace("#", "0x"), base=16)
+
+
+@lru_cache(maxsize=4096)
+def _rgb_hex(value: int) -> str:
+    """Convert a raw color value into RGB hex string. Cached, colors are serialized repeatedly in API responses."""
+    return "#" + (value & 0xFFFFFF).to_bytes(3, "big").hex()
+
+
 def generate_pattern(
     colors: Iterable[int],
     length: int,
@@ -179,32 +221,19 @@ def generate_pattern(
     Returns:
         Full list patterned to the requested length.
     """
-    colors = colors or [Colors.BLACK.value]
-    pattern = []
+    colors = list(colors) or [Colors.BLACK.value]
     if randomize:
         if len(colors) > 1:
-            for _ in range(length):
-                pattern.append(random.choice(colors))  # nosec B311
-        else:
-            pattern = colors * length
-    elif mirror:
+            return random.choices(colors, k=length)  # nosec B311
+        return colors * length
+    if mirror:
         # Mirror (reverse) colors after all are used.
-        current = 0
-        for _ in range(length):
-            pattern.append(colors[current])
-            current += 1
-            if current >= len(colors):
-                current = 0
-                colors = colors[::-1]
+        cycle = colors + colors[::-1]
     else:
         # Repeat (start over) colors after all are used.
-        current = 0
-        for _ in range(length):
-            pattern.append(colors[current])
-            current += 1
-            if current >= len(colors):
-                current = 0
-    return pattern
+        cycle = colors
+    # Build the full pattern with whole copies of the cycle, then trim the remainder.
+    return (cycle * -(-length // len(cycle)))[:length]
 
 
 def hue_to_rgb(hue: float, chroma: float, secondary: float, match: float) -> Color:
@@ -260,7 +289,8 @@ def rgb_to_hue(red: float, green: float, blue: float, max_rgb: float, delta: flo
         Degree on a color wheel representing the color.
     """
     hue = float("nan")
-    if max_rgb == 0.0:
+    if delta == 0.0:
+        # Greys, including black and white, have no hue.
         hue = 0.0
     elif max_rgb == red:
         hue = 60.0 * (((green - blue) / delta) % 6)
@@ -283,10 +313,10 @@ def parse_color(value: str | int | float | Colors) -> Color:
     if isinstance(value, Color):
         return value
     if isinstance(value, Colors):
-        return value.value
+        # Read the stored member value directly to skip the enum "value" descriptor on every palette color.
+        return value._value_  # Documented enum attribute. pylint: disable=protected-access
     if isinstance(value, (int, float)):
         return Color(value)
     if isinstance(value, str):
-        raw_color = value.replace("#", "0x")
-        return Color(raw_color, base=16)
+        return _parse_color_str(value)
     raise ValueError(f"{value} is not a valid color/int value")
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-import threading
 from typing import Any
 
 from huereka.common import color_utils
 from huereka.shared.collections import KEY_ID
 from huereka.shared.collections import Collection
 from huereka.shared.collections import CollectionEntry
+from huereka.shared.collections import CollectionRWLock
 from huereka.shared.collections import CollectionValueError
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,8 @@ KEY_VALUE = "value"
 class Color(CollectionEntry):
     """User color preference."""
 
+    __slots__ = ("_color",)
+
     def __init__(
         self,
         name: str,
@@ -89,7 +91,7 @@ class Colors(Collection):
     """Singleton for managing reusable colors."""
 
     _collection: dict[str, Color] = {}
-    _collection_lock: threading.Condition = threading.Condition()
+    _collection_lock: CollectionRWLock = CollectionRWLock()
     _collection_uri: str = None
 
     collection_help: str = "colors"
@@ -108,7 +110,7 @@ class Colors(Collection):
         cls,
         uuid: str,
         new_values: dict,
-    ) -> dict:
+    ) -> tuple[dict, set[str]]:
         """Update the values of a color.
 
         Args:
@@ -116,9 +118,11 @@ class Colors(Collection):
             new_values: New JSON like attributes to set on the color.
 
         Returns:
-            Final color configuration with the updated values.
+            Final color configuration with the updated values, and the keys of the values that changed.
         """
+        changed = set()
         with cls._collection_lock:
+            cls._collection_json = None
             color = cls.get(uuid)
             name = new_values.get(KEY_NAME)
             if name is not None:
@@ -127,9 +131,14 @@ class Colors(Collection):
                 original_name = color.name
                 color.name = name
                 cls._collection[name] = cls._collection.pop(original_name)
+                if name != original_name:
+                    changed.add(KEY_NAME)
             value = new_values.get(KEY_VALUE)
             if value is None or not isinstance(value, (str, int, float)):
                 raise CollectionValueError("invalid-color-value")
+            original_value = color.value
             color.value = value
+            if color.value != original_value:
+                changed.add(KEY_VALUE)
             result = color.to_json()
-        return result
+        return result, changed
@@ -0,0 +1,234 @@
+"""Extensions for Flask web servers."""
+
+from typing import Any
+from typing import Callable
+
+import orjson
+from flask import Blueprint
+from flask import Response
+from flask import current_app
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+from huereka.common import persistence
+from huereka.shared import responses
+from huereka.shared.collections import Collection
+
+# Serialized JSON of collection entries, paired with the cached entries they were created from.
+_serialized_collections: dict[type[Collection], tuple[list[dict], bytes]] = {}
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider using orjson to reduce the cost of parsing requests and serializing responses."""
+
+    def dumpb(self, obj: Any, indent: bool = False) -> bytes:
+        """Serialize data as JSON to UTF-8 bytes using the provider settings.
+
+        Args:
+            obj: Data to serialize.
+            indent: Whether to pretty-print the output.
+
+        Returns:
+            JSON encoded bytes.
+        """
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON to a string."""
+        return self.dumpb(obj, indent=kwargs.get("indent") is not None).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize data as JSON from a string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the arguments directly to bytes to skip re-encoding the response text."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumpb(obj, indent=_indent()) + b"\n", mimetype=self.mimetype)
+
+
+class _CollectionRoutes:
+    """Standard create, read, update, and delete views for a collection."""
+
+    def __init__(
+        self,
+        collection: type[Collection],
+        reserved: frozenset[str],
+        on_update: Callable[[set[str]], None] | None,
+        on_create: Callable[[], None] | None,
+    ) -> None:
+        """Set up the views for a collection.
+
+        Args:
+            collection: Collection to manage with the views.
+            reserved: Entries managed by the server that may not be created, modified, or removed by users.
+            on_update: Function to call with the keys of the values that changed, if any, after an entry is updated.
+            on_create: Function to call after an entry is created.
+        """
+        self.collection = collection
+        self.reserved = reserved
+        self.on_update = on_update
+        self.on_create = on_create
+
+    def collection_get(self) -> Response:
+        """Find all currently saved entries."""
+        return ok_collection(self.collection)
+
+    def collection_post(self) -> Response | tuple:
+        """Create a new entry."""
+        entry = self.collection.entry_cls.from_json(request_body())
+        if entry.name in self.reserved:
+            return responses.not_allowed()
+        persistence.commit_register(self.collection, entry)
+        if self.on_create is not None:
+            self.on_create()
+        return ok_item(entry.to_json())
+
+    def collection_delete_entry(self, uuid: str) -> Response | tuple:
+        """Remove an entry."""
+        if uuid in self.reserved:
+            return responses.not_allowed()
+        entry = persistence.commit_remove(self.collection, uuid)
+        return ok(entry.to_json())
+
+    def collection_get_entry(self, uuid: str) -> Response:
+        """Find an entry."""
+        return ok(self.collection.get(uuid).to_json())
+
+    def collection_put_entry(self, uuid: str) -> Response | tuple:
+        """Update an entry's configuration."""
+        if uuid in self.reserved:
+            return responses.not_allowed()
+        result, changed = persistence.commit_update(self.collection, uuid, request_body())
+        # Called even if nothing changed, so that an unchanged update can be used to reapply an entry.
+        if self.on_update is not None:
+            self.on_update(changed)
+        return ok(result)
+
+
+def add_collection_routes(
+    blueprint: Blueprint,
+    name: str,
+    collection: type[Collection],
+    *,
+    reserved: frozenset[str] = frozenset(),
+    on_update: Callable[[set[str]], None] | None = None,
+    on_create: Callable[[], None] | None = None,
+) -> None:
+    """Register the standard create, read, update, and delete routes for a collection.
+
+    Adds "/<name>" with GET and POST, and "/<name>/<uuid>" with DELETE, GET, and PUT.
+
+    Args:
+        blueprint: Flask blueprint to add the routes to.
+        name: Name of the collection in the route paths and endpoint names.
+        collection: Collection to manage with the routes.
+        reserved: Entries managed by the server that may not be created, modified, or removed by users.
+        on_update: Function to call with the keys of the values that changed, if any, after an entry is updated.
+        on_create: Function to call after an entry is created.
+    """
+    views = _CollectionRoutes(collection, reserved, on_update, on_create)
+    routes = (
+        (f"/{name}", "GET", views.collection_get),
+        (f"/{name}", "POST", views.collection_post),
+        (f"/{name}/<string:uuid>", "DELETE", views.collection_delete_entry),
+        (f"/{name}/<string:uuid>", "GET", views.collection_get_entry),
+        (f"/{name}/<string:uuid>", "PUT", views.collection_put_entry),
+    )
+    for rule, method, view in routes:
+        endpoint = view.__name__.replace("collection", name, 1)
+        blueprint.add_url_rule(rule, endpoint=endpoint, view_func=view, methods=[method])
+
+
+def _dumpb(obj: Any, indent: bool = False) -> bytes:
+    """Serialize data as JSON to UTF-8 bytes using the JSON provider of the current app.
+
+    Apps that do not use the ORJSONProvider fall back to encoding the text from their provider.
+    """
+    provider = current_app.json
+    if isinstance(provider, ORJSONProvider):
+        return provider.dumpb(obj, indent=indent)
+    return provider.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _indent() -> bool:
+    """Whether responses from the current app should be pretty-printed, matching the default Flask JSON responses."""
+    compact = current_app.json.compact
+    return (compact is None and current_app.debug) or compact is False
+
+
+def _json_response(body: bytes, status: int) -> Response:
+    """Create a response from serialized JSON, bypassing the conversion of view return values by Flask."""
+    return current_app.response_class(body, status=status, mimetype=current_app.json.mimetype)
+
+
+def ok(data: Any = "ok") -> Response:  # Intentionally short name. pylint: disable=invalid-name
+    """Create a JSON API response for a 200 code representing valid request and response.
+
+    Args:
+        data: Optional data to return in the response body.
+
+    Returns:
+        A basic response with the data as the body, and 200 response code.
+    """
+    body, status_code = responses.ok(data)
+    return _json_response(_dumpb(body, indent=_indent()) + b"\n", status_code)
+
+
+def ok_item(item: dict) -> Response:
+    """Create a JSON API response for a 200 code containing a single item.
+
+    The envelope is assembled around the serialized item directly, instead of serializing a wrapping mapping, unless
+    the response is pretty-printed.
+
+    Args:
+        item: JSON compatible item to return in the response body.
+
+    Returns:
+        A response with an item count of 1 and the item as the body, and 200 response code.
+    """
+    if _indent():
+        return _json_response(_dumpb({"item_count": 1, "items": item}, indent=True) + b"\n", responses.STATUS_OK)
+    body = b'{"item_count":1,"items":%b}\n' % _dumpb(item)
+    return _json_response(body, responses.STATUS_OK)
+
+
+def ok_collection(collection: type[Collection]) -> Response:
+    """Create a JSON API response for a 200 code containing all entries in a collection and their count.
+
+    The entries are only serialized again after the cached JSON of the collection changes, and the envelope is
+    assembled around the serialized entries directly, instead of serializing a wrapping mapping. Pretty-printed
+    responses, such as in debug mode, are not cached.
+
+    Args:
+        collection: Collection to return the entries of in the response body.
+
+    Returns:
+        A response with the entry count and entries as the body, and 200 response code.
+    """
+    items = collection.to_json()
+    if _indent():
+        body = {"item_count": len(items), "items": items}
+        return _json_response(_dumpb(body, indent=True) + b"\n", responses.STATUS_OK)
+    serialized = _serialized_collections.get(collection)
+    # The cached entries are replaced, not modified, on change. Holding a reference prevents the ID being reused.
+    if serialized is None or serialized[0] is not items:
+        serialized = (items, _dumpb(items))
+        _serialized_collections[collection] = serialized
+    body = b'{"item_count":%d,"items":%b}\n' % (len(items), serialized[1])
+    return _json_response(body, responses.STATUS_OK)
+
+
+def request_body() -> Any:
+    """Parse the JSON body of the current request, regardless of the content type.
+
+    Returns:
+        Parsed JSON value.
+
+    Raises:
+        BadRequest if the body is empty or is not valid JSON.
+    """
+    return request.get_json(force=True)
@@ -4,6 +4,9 @@ import importlib
 import os
 from glob import glob
 
+# Module names found by previous top level imports, to avoid walking the filesystem again for the same folder.
+_imported_cache: dict[tuple[str, str, bool], list[str]] = {}
+
 
 def import_modules(module_folder: str, package: str, recursive: bool = True, imported: list = None) -> list[str]:
     """Import all modules in a directory.
@@ -17,8 +20,15 @@ def import_modules(module_folder: str, package: str, recursive: bool = True, imp
     Returns:
         imported: The name of all modules imported.
     """
+    cache_key = None
     # Must check explicitly for None, otherwise an empty module directory will reset the shared list.
     if imported is None:
+        cache_key = (module_folder, package, recursive)
+        cached = _imported_cache.get(cache_key)
+        if cached is not None:
+            for module_name in cached:
+                importlib.import_module(module_name)
+            return cached.copy()
         imported = []
     for abs_path in glob(os.path.join(module_folder, "*.py")):
         filename = os.path.basename(abs_path)
@@ -35,4 +45,6 @@ def import_modules(module_folder: str, package: str, recursive: bool = True, imp
             sub_dir = os.path.join(module_folder, directory)
             sub_module = f"{package}.{directory}"
             import_modules(sub_dir, sub_module, recursive=True, imported=imported)
+    if cache_key is not None:
+        _imported_cache[cache_key] = imported.copy()
     return imported
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-import threading
+from typing import Iterable
 from typing import Sequence
 
 from adafruit_pixelbuf import ColorUnion
@@ -17,6 +17,7 @@ from huereka.shared.collections import KEY_ID
 from huereka.shared.collections import KEY_NAME
 from huereka.shared.collections import Collection
 from huereka.shared.collections import CollectionEntry
+from huereka.shared.collections import CollectionRWLock
 from huereka.shared.collections import CollectionValueError
 from huereka.shared.collections import get_and_validate
 
@@ -35,6 +36,32 @@ MODE_ON = 1
 STATUS_OFF = 0
 STATUS_ON = 1
 
+# Micromanagers available to control LED hardware, by lowercase type name.
+MICROMANAGER_TYPES: dict[str, type[micro_managers.LEDMicroManager]] = {
+    "neopixel": micro_managers.NeoPixelManager,
+    "serial": micro_managers.SerialManager,
+}
+
+
+def _device_key(data: dict) -> tuple | None:
+    """Create a key to identify the hardware used by an LED manager configuration.
+
+    Args:
+        data: Mapping of the manager attributes.
+
+    Returns:
+        Type and location of the LEDs, or None if the type is not known.
+    """
+    manager_type = data.get(KEY_TYPE)
+    if not isinstance(manager_type, str):
+        return None
+    manager_type = manager_type.lower()
+    if manager_type == "neopixel":
+        return manager_type, data.get(KEY_PIN)
+    if manager_type == "serial":
+        return manager_type, data.get(KEY_PORT)
+    return None
+
 
 class LEDManager(CollectionEntry):
     """Manage the colors and brightness of LEDs.
@@ -43,6 +70,8 @@ class LEDManager(CollectionEntry):
     should be performed in this class, and only passthroughs to micromanagers are allowed.
     """
 
+    __slots__ = ("_led_manager", "_mode", "_status", "led_delay")
+
     def __init__(
         self,
         name: str = None,
@@ -61,7 +90,6 @@ class LEDManager(CollectionEntry):
             micromanager: Low level manager that controls connectivity and messaging to LED hardware.
         """
         super().__init__(uuid=uuid, name=name)
-        self._mode = MODE_OFF
         self._status = STATUS_OFF
         self._led_manager = micromanager
         self.mode = mode
@@ -104,7 +132,8 @@ class LEDManager(CollectionEntry):
         """
         # Required arguments.
         manager_type = data.get(KEY_TYPE)
-        if not isinstance(manager_type, str) or manager_type.lower() not in ("neopixel", "serial"):
+        micromanager_cls = MICROMANAGER_TYPES.get(manager_type.lower()) if isinstance(manager_type, str) else None
+        if micromanager_cls is None:
             raise CollectionValueError("invalid-led_manager-type")
         uuid = data.get(KEY_ID)
         if not uuid or not isinstance(uuid, str):
@@ -112,7 +141,7 @@ class LEDManager(CollectionEntry):
 
         # Optional arguments.
         name = data.get(KEY_NAME)
-        if not isinstance(uuid, str) and name is not None:
+        if not isinstance(name, str) and name is not None:
             raise CollectionValueError("invalid-led_manager-name")
         mode = data.get(KEY_MODE, MODE_OFF)
         if not isinstance(mode, int):
@@ -120,11 +149,7 @@ class LEDManager(CollectionEntry):
         led_delay = data.get(KEY_LED_DELAY, DEFAULT_LED_UPDATE_DELAY)
         if not isinstance(led_delay, float):
             raise CollectionValueError("invalid-led_manager-led_delay")
-        micromanager = None
-        if manager_type.lower() == "neopixel":
-            micromanager = micro_managers.NeoPixelManager.from_json(data)
-        elif manager_type.lower() == "serial":
-            micromanager = micro_managers.SerialManager.from_json(data)
+        micromanager = micromanager_cls.from_json(data)
 
         return LEDManager(name=name, uuid=uuid, mode=mode, micromanager=micromanager, led_delay=led_delay)
 
@@ -217,7 +242,7 @@ class LEDManager(CollectionEntry):
         valid_states = (STATUS_OFF, STATUS_ON)
         if status not in valid_states:
             raise ValueError(f"Valid states are: {valid_states}")
-        if status == STATUS_ON and self.mode == MODE_OFF:
+        if status == STATUS_ON and self._mode == MODE_OFF:
             raise ValueError("Status may not be set to on while mode is set to off")
         self._status = status
 
@@ -237,47 +262,86 @@ class LEDManager(CollectionEntry):
         data = self._led_manager.to_json()
         data[KEY_ID] = self.uuid
         data[KEY_NAME] = self.name
-        data[KEY_MODE] = self.mode
+        data[KEY_MODE] = self._mode
         data[KEY_LED_DELAY] = self.led_delay
         if not save_only:
-            data[KEY_STATUS] = self.status
+            data[KEY_STATUS] = self._status
         return data
 
     def update(
         self,
         new_values: dict,
-    ) -> dict:
+    ) -> tuple[dict, set[str]]:
         """Update the values of an LED manager.
 
         Args:
             new_values: New attributes to set on the manager.
 
         Returns:
-            Final manager configuration with the updated values.
+            Final manager configuration with the updated values, and the keys of the manager values that changed.
         """
+        changed = set()
         name = get_and_validate(new_values, KEY_NAME, str)
         if name is not None and name != self.name:
             self.name = name
+            changed.add(KEY_NAME)
         mode = get_and_validate(new_values, KEY_MODE, int)
-        if mode is not None and mode != self.mode:
+        if mode is not None and mode != self._mode:
             self.mode = mode
+            changed.add(KEY_MODE)
         led_delay = get_and_validate(new_values, KEY_LED_DELAY, float)
-        if led_delay is not None:
+        if led_delay is not None and led_delay != self.led_delay:
             self.led_delay = led_delay
+            changed.add(KEY_LED_DELAY)
         self._led_manager.update(new_values)
-        return self.to_json()
+        return self.to_json(), changed
 
 
 class LEDManagers(Collection):
-    """Singleton for managing concurrent access to LEDs connected to GPIO pins."""
+    """Singleton for managing concurrent access to LEDs connected to GPIO pins.
+
+    LED operations only hold a read lock on the collection, to prevent managers being removed while in use. Each
+    micromanager serializes access to its own hardware, so operations on separate managers do not block each other.
+    """
 
     _collection: dict[str, LEDManager] = {}
-    _collection_lock: threading.Condition = threading.Condition()
+    _collection_lock: CollectionRWLock = CollectionRWLock()
     _collection_uri: str = None
 
     collection_help: str = "LED managers"
     entry_cls: str = LEDManager
 
+    # Number of registered managers using each device, to find duplicates without a full scan.
+    # Managers created through the API are not checked for duplicates, so a device may be used more than once.
+    _used_devices: dict[tuple, int] = {}
+    # Hardware used by managers set up during the current load, which are not registered until the load completes.
+    _pending_devices: set[tuple] = set()
+
+    @classmethod
+    def _add_pending(cls, entry: LEDManager, pending: dict[str, LEDManager]) -> None:
+        """Hold a manager that is set up during load, and its hardware to find duplicates in the same load."""
+        super()._add_pending(entry, pending)
+        device = _device_key(entry.to_json(save_only=True))
+        if device is not None:
+            cls._pending_devices.add(device)
+
+    @classmethod
+    def _index_device(cls, device: tuple | None) -> None:
+        """Add a registered manager's hardware to the index."""
+        if device is not None:
+            cls._used_devices[device] = cls._used_devices.get(device, 0) + 1
+
+    @classmethod
+    def _unindex_device(cls, device: tuple | None) -> None:
+        """Remove a registered manager's hardware from the index, if no other registered manager uses it."""
+        count = cls._used_devices.get(device)
+        if count is None:
+            return
+        if count > 1:
+            cls._used_devices[device] = count - 1
+        else:
+            del cls._used_devices[device]
+
     @classmethod
     def get(cls, key: str) -> LEDManager:
         """Find the manager associated with a given key.
@@ -286,6 +350,25 @@ class LEDManagers(Collection):
         """
         return super().get(key)
 
+    @classmethod
+    def register_many(cls, entries: Iterable[LEDManager]) -> None:
+        """Store multiple managers for concurrent access as a single change, and index their hardware."""
+        entries = list(entries)
+        with cls._collection_lock:
+            super().register_many(entries)
+            for entry in entries:
+                device = _device_key(entry.to_json(save_only=True))
+                cls._index_device(device)
+                cls._pending_devices.discard(device)
+
+    @classmethod
+    def remove(cls, key: str) -> LEDManager:
+        """Remove a manager from persistent storage, and its hardware from the index."""
+        with cls._collection_lock:
+            manager = super().remove(key)
+            cls._unindex_device(_device_key(manager.to_json(save_only=True)))
+        return manager
+
     @classmethod
     def set_brightness(
         cls,
@@ -302,8 +385,10 @@ class LEDManagers(Collection):
             show: Whether to show the change immediately, or delay until the next show() is called.
             save: Whether to save the value permanently, or only set temporarily.
         """
-        with cls._collection_lock:
+        with cls._collection_lock.read():
             cls.get(uuid).set_brightness(brightness, show=show, save=save)
+        if save:
+            cls.invalidate_json()
 
     @classmethod
     def set_color(
@@ -321,7 +406,7 @@ class LEDManagers(Collection):
             index: Position of the LED in the chain. Defaults to -1 to fill all.
             show: Whether to show the change immediately, or delay until the next show() is called.
         """
-        with cls._collection_lock:
+        with cls._collection_lock.read():
             cls.get(uuid).set_color(color, index=index, show=show)
 
     @classmethod
@@ -341,9 +426,8 @@ class LEDManagers(Collection):
                 Defaults to manager delay. Overridden by manager delay if too low.
             show: Whether to show the change immediately, or delay until the next show() is called.
         """
-        with cls._collection_lock:
-            manager = cls.get(uuid)
-            manager.set_colors(colors, delay=delay, show=show)
+        with cls._collection_lock.read():
+            cls.get(uuid).set_colors(colors, delay=delay, show=show)
 
     @classmethod
     def shutoff(cls, uuid: str) -> None:
@@ -352,7 +436,7 @@ class LEDManagers(Collection):
         Args:
             uuid: ID of the manager to use to send the signal.
         """
-        with cls._collection_lock:
+        with cls._collection_lock.read():
             cls.get(uuid).off()
 
     @classmethod
@@ -362,7 +446,7 @@ class LEDManagers(Collection):
         Args:
             uuid: ID of the manager to use to send the signal.
         """
-        with cls._collection_lock:
+        with cls._collection_lock.read():
             cls.get(uuid).show()
 
     @classmethod
@@ -372,26 +456,42 @@ class LEDManagers(Collection):
         Managers should not be reused after teardown.
         """
         with cls._collection_lock:
-            for uuid in list(cls._collection.keys()):
-                manager: LEDManager = cls.remove(uuid)
-                manager.teardown()
+            managers = list(cls._collection.values())
+            cls._collection.clear()
+            cls._collection_json = None
+            cls._used_devices = {}
+            cls._pending_devices = set()
+        # Managers are no longer reachable from the collection, release the hardware without blocking other callers.
+        for manager in managers:
+            manager.teardown()
 
     @classmethod
-    def validate_entry(cls, data: dict, index: int) -> bool:
+    def update(
+        cls,
+        uuid: str,
+        new_values: dict,
+    ) -> tuple[dict, set[str]]:
+        """Update the values of a manager, and reindex its hardware in case it changed."""
+        with cls._collection_lock:
+            manager = cls.get(uuid)
+            old_device = _device_key(manager.to_json(save_only=True))
+            result = super().update(uuid, new_values)
+            cls._unindex_device(old_device)
+            cls._index_device(_device_key(manager.to_json(save_only=True)))
+        return result
+
+    @classmethod
+    def validate_entry(cls, data: dict, index: int, pending: dict[str, LEDManager] | None = None) -> bool:
         """Additional confirmation of entry values before load."""
-        if not super().validate_entry(data, index):
+        if not super().validate_entry(data, index, pending=pending):
+            return False
+        device = _device_key(data)
+        if device is None:
+            # Unknown types are reported by the manager setup.
+            return True
+        if device in cls._used_devices or device in cls._pending_devices:
+            logger.warning(
+                f"Skipping duplicate {cls.collection_help} setup at index {index} using {' '.join(map(str, device))}"
+            )
             return False
-        manager_type = data.get(KEY_TYPE)
-        if manager_type.lower() == "neopixel":
-            pin = data.get(KEY_PIN)
-            for manager in cls._collection:
-                if isinstance(manager, micro_managers.NeoPixelManager) and manager.led_pin == pin:
-                    logger.warning(f"Skipping duplicate {cls.collection_help} setup at index {index} using pin {pin}")
-                    return False
-        elif manager_type.lower() == "serial":
-            port = data.get(KEY_PORT)
-            for manager in cls._collection:
-                if isinstance(manager, micro_managers.SerialManager) and manager.port == port:
-                    logger.warning(f"Skipping duplicate {cls.collection_help} setup at index {index} using port {port}")
-                    return False
         return True
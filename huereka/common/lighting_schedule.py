@@ -5,8 +5,8 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from datetime import datetime
 from typing import Any
+from typing import Iterable
 
 from huereka.common import color_profile
 from huereka.common import color_utils
@@ -15,13 +15,15 @@ from huereka.shared import responses
 from huereka.shared.collections import KEY_ID
 from huereka.shared.collections import Collection
 from huereka.shared.collections import CollectionEntry
+from huereka.shared.collections import CollectionRWLock
 from huereka.shared.collections import CollectionValueError
 from huereka.shared.collections import get_and_validate
 
 logger = logging.getLogger(__name__)
 
 __WATCHDOG__ = None
-__WATCHDOG_SLEEP__ = True
+__WATCHDOG_STOP__ = threading.Event()
+__WATCHDOG_WAKE__ = threading.Event()
 
 KEY_ROUTINES = "routines"
 KEY_NAME = "name"
@@ -46,6 +48,22 @@ DAY_FRIDAY = 16
 DAY_SATURDAY = 32
 DAY_SUNDAY = 64
 DAYS_ALL = DAY_MONDAY | DAY_TUESDAY | DAY_WEDNESDAY | DAY_THURSDAY | DAY_FRIDAY | DAY_SATURDAY | DAY_SUNDAY
+# Human readable days for every combination of day flags, starting from Sunday.
+_DAYS_HUMAN = tuple(
+    "".join(
+        char if days & flag else "-"
+        for char, flag in (
+            ("S", DAY_SUNDAY),
+            ("M", DAY_MONDAY),
+            ("T", DAY_TUESDAY),
+            ("W", DAY_WEDNESDAY),
+            ("T", DAY_THURSDAY),
+            ("F", DAY_FRIDAY),
+            ("S", DAY_SATURDAY),
+        )
+    )
+    for days in range(DAYS_ALL + 1)
+)
 
 MODE_OFF = 0
 MODE_ON = 1
@@ -55,9 +73,55 @@ STATUS_OFF = 0
 STATUS_ON = 1
 
 
+def _now_snapshot() -> tuple[int, int]:
+    """Read the current time once, for use across multiple routine activity checks.
+
+    Returns:
+        Current time of day in seconds, and the current ISO weekday.
+    """
+    now = time.localtime()
+    # Weekdays start from 0 on Monday, ISO weekdays start from 1.
+    return now.tm_hour * 60 * 60 + now.tm_min * 60 + now.tm_sec, now.tm_wday + 1
+
+
+def _parse_time(value: str, label: str, max_hour: int) -> int:
+    """Convert a human readable HH:MM time of day into seconds.
+
+    Args:
+        value: Time of day in HH:MM format.
+        label: Name of the time used in error messages.
+        max_hour: Maximum hour allowed. 24 is only allowed as 24:00, to represent the end of the day.
+
+    Returns:
+        Time of day in seconds.
+
+    Raises:
+        CollectionValueError if the value is not a valid time.
+    """
+    hour, separator, minute = value.partition(":")
+    if not separator or not hour.isdecimal() or not minute.isdecimal():
+        raise CollectionValueError(f"{label} time must be in format HH:MM")
+    hour = int(hour)
+    minute = int(minute)
+    if hour > max_hour:
+        raise CollectionValueError(f"{label} hour must be between 0 and {max_hour}")
+    if hour == 24 and minute > 0:
+        raise CollectionValueError(f"{label} minute must be 0 if hour is 24")
+    if minute > 59:
+        raise CollectionValueError(f"{label} minute must be between 0 and 59")
+    return hour * 60 * 60 + minute * 60
+
+
+def _format_time(seconds: int | float) -> str:
+    """Convert a time of day in seconds into human readable HH:MM."""
+    return f"{int(seconds / 3600):02}:{int(seconds % 3600 / 60):02}"
+
+
 class LightingRoutine:  # Approved override of default. pylint: disable=too-many-instance-attributes
     """Details for running a specific color/lighting profile during a timeframe."""
 
+    __slots__ = ("_days", "_end", "_end_time", "_mode", "_start", "_start_time", "_status", "brightness", "profile")
+
     def __init__(  # Approved override of the default argument limit. pylint: disable=too-many-arguments
         self,
         profile: str = None,
@@ -82,15 +146,19 @@ class LightingRoutine:  # Approved override of default. pylint: disable=too-many
         self._mode = MODE_ON
         self._status = STATUS_OFF
         self._start = 0
+        self._start_time = "00:00"
         self._end = 86400
+        self._end_time = "24:00"
         self.profile = profile
         self.start = start
         self.end = end
         if isinstance(days, int):
             self._days = days
         else:
+            combined_days = 0
             for day in days:
-                self._set_day(day)
+                combined_days |= day
+            self._days = combined_days
         self.mode = mode
         self.brightness = brightness
 
@@ -105,10 +173,6 @@ class LightingRoutine:  # Approved override of default. pylint: disable=too-many
             and self.brightness == other.brightness
         )
 
-    def _set_day(self, day: int) -> None:
-        """Toggle combination flag for a day on."""
-        self._days |= day
-
     def _unset_day(self, mode: int) -> None:
         """Toggle combination flag for a day off."""
         self._days &= ~mode
@@ -116,24 +180,32 @@ class LightingRoutine:  # Approved override of default. pylint: disable=too-many
     @property
     def active(self) -> bool:
         """Determine if the current time is in the active window (inclusive start and end)."""
+        return self.active_at(*_now_snapshot())
+
+    def active_at(self, now_in_seconds: int, today: int) -> bool:
+        """Determine if a time is in the active window (inclusive start and end).
+
+        Args:
+            now_in_seconds: Time of day in seconds.
+            today: ISO weekday of the time.
+
+        Returns:
+            True if the routine is enabled and the time falls within the active window, False otherwise.
+        """
         if self.mode == MODE_ON and self.profile:
-            now = datetime.now()
+            # Day flags are ordered by ISO weekday, so the flag for a day is found by its offset from Monday.
+            today_flag = 1 << (today - 1)
             if self.start < self.end:
                 # Start is before end, routine is active if between the two.
-                if self._days == DAYS_ALL or self._days & now.isoweekday() != 0:
-                    now_in_seconds = now.hour * 60 * 60 + now.minute * 60 + now.second
-                    if self.start <= now_in_seconds <= self.end:
-                        return True
+                if self._days & today_flag and self.start <= now_in_seconds <= self.end:
+                    return True
             else:
                 # End is before start, routine is active if falls into daily rollover window to next day.
-                today = now.isoweekday()
-                next_day = today - 1
-                if next_day == 8:
-                    next_day = 1
-                now_in_seconds = now.hour * 60 * 60 + now.minute * 60 + now.second
-                if now_in_seconds >= self.start and (self.days == DAYS_ALL or self._days & today != 0):
+                if now_in_seconds >= self.start and self._days & today_flag:
                     return True
-                if now_in_seconds <= self.end and (self.days == DAYS_ALL or self._days & next_day != 0):
+                # Routines continuing from the previous day are enabled by the previous day's flag.
+                previous_day_flag = DAY_SUNDAY if today == 1 else today_flag >> 1
+                if now_in_seconds <= self.end and self._days & previous_day_flag:
                     return True
         return False
 
@@ -145,15 +217,7 @@ class LightingRoutine:  # Approved override of default. pylint: disable=too-many
     @property
     def days_human(self) -> str:
         """Provide human readable string for days."""
-        days = ""
-        days += "S" if self.days & DAY_SUNDAY != 0 else "-"
-        days += "M" if self.days & DAY_MONDAY != 0 else "-"
-        days += "T" if self.days & DAY_TUESDAY != 0 else "-"
-        days += "W" if self.days & DAY_WEDNESDAY != 0 else "-"
-        days += "T" if self.days & DAY_THURSDAY != 0 else "-"
-        days += "F" if self.days & DAY_FRIDAY != 0 else "-"
-        days += "S" if self.days & DAY_SATURDAY != 0 else "-"
-        return days
+        return _DAYS_HUMAN[self._days & DAYS_ALL]
 
     @property
     def end(self) -> int:
@@ -171,24 +235,15 @@ class LightingRoutine:  # Approved override of default. pylint: disable=too-many
             if end < 0 or end > 86400:
                 raise CollectionValueError("End time must be between 0 and 86400 seconds.")
             self._end = end
+            self._end_time = _format_time(end)
         elif isinstance(end, str):
-            if ":" not in end or end.count(":") > 1:
-                raise CollectionValueError("End time must be in format HH:MM")
-            hour, minute = end.split(":")
-            hour = int(hour)
-            minute = int(minute)
-            if hour < 0 or hour > 24:
-                raise CollectionValueError("End hour must be between 0 and 24")
-            if hour == 24 and minute > 0:
-                raise CollectionValueError("End minute must be 0 if hour is 24")
-            if minute < 0 or minute > 59:
-                raise CollectionValueError("End minute must be between 0 and 59")
-            self._end = hour * 60 * 60 + minute * 60
+            self._end = _parse_time(end, "End", 24)
+            self._end_time = _format_time(self._end)
 
     @property
     def end_time(self) -> str:
         """Provide human readable value for end."""
-        return f"{int(self.end / 3600):02}:{int(self.end % 3600 / 60):02}"
+        return self._end_time
 
     @classmethod
     def from_json(cls, data: dict) -> LightingRoutine:
@@ -257,22 +312,15 @@ class LightingRoutine:  # Approved override of default. pylint: disable=too-many
             if start < 0 or start > 86400:
                 raise CollectionValueError("Start time must be between 0 and 86400 seconds.")
             self._start = int(start)
+            self._start_time = _format_time(self._start)
         elif isinstance(start, str):
-            if ":" not in start or start.count(":") > 1:
-                raise CollectionValueError("Start time must be in format HH:MM")
-            hour, minute = start.split(":")
-            hour = int(hour)
-            minute = int(minute)
-            if hour < 0 or hour > 23:
-                raise CollectionValueError("Start hour must be between 0 and 23")
-            if minute < 0 or minute > 59:
-                raise CollectionValueError("Start minute must be between 0 and 59")
-            self._start = hour * 60 * 60 + minute * 60
+            self._start = _parse_time(start, "Start", 23)
+            self._start_time = _format_time(self._start)
 
     @property
     def start_time(self) -> str:
         """Provide human readable value for start."""
-        return f"{int(self.start / 3600):02}:{int(self.start % 3600 / 60):02}"
+        return self._start_time
 
     @property
     def status(self) -> int:
@@ -298,19 +346,21 @@ class LightingRoutine:  # Approved override of default. pylint: disable=too-many
         data = {
             KEY_PROFILE: self.profile,
             KEY_DAYS: self._days,
-            KEY_START: self.start_time,
-            KEY_END: self.end_time,
-            KEY_MODE: self.mode,
+            KEY_START: self._start_time,
+            KEY_END: self._end_time,
+            KEY_MODE: self._mode,
             KEY_BRIGHTNESS: self.brightness,
         }
         if not save_only:
-            data[KEY_STATUS] = self.status
+            data[KEY_STATUS] = self._status
         return data
 
 
 class LightingSchedule(CollectionEntry):
     """Schedule used to control active color profile on an LED strip."""
 
+    __slots__ = ("_mode", "_status", "brightness", "led_delay", "manager", "routines")
+
     def __init__(  # Approved override of default. pylint: disable=too-many-arguments
         self,
         name: str,
@@ -357,15 +407,27 @@ class LightingSchedule(CollectionEntry):
     @property
     def active(self) -> LightingRoutine | None:
         """Get the currently active routine from this schedule if one is available."""
-        active_routine = OffLightingRoutine
-        if self.mode == MODE_AUTO:
-            for routine in self.routines:
-                if routine.active:
-                    active_routine = routine
-                    break
-        if self.mode == MODE_ON and active_routine is OffLightingRoutine and len(self.routines) > 0:
-            active_routine = self.routines[0]
-        return active_routine
+        return self.active_at(*_now_snapshot())
+
+    def active_at(self, now_in_seconds: int, today: int) -> LightingRoutine | None:
+        """Get the routine from this schedule that is active at a time if one is available.
+
+        Args:
+            now_in_seconds: Time of day in seconds.
+            today: ISO weekday of the time.
+
+        Returns:
+            The first active routine, or the off routine if none are active.
+        """
+        mode = self._mode
+        routines = self.routines
+        if mode == MODE_AUTO:
+            for routine in routines:
+                if routine.active_at(now_in_seconds, today):
+                    return routine
+        elif mode == MODE_ON and routines:
+            return routines[0]
+        return OffLightingRoutine
 
     @classmethod
     def from_json(cls, data: dict) -> LightingSchedule:
@@ -450,15 +512,16 @@ class LightingSchedule(CollectionEntry):
             KEY_NAME: self.name,
             KEY_MANAGER: self.manager,
             KEY_ROUTINES: [routine.to_json(save_only=save_only) for routine in self.routines],
-            KEY_MODE: self.mode,
+            KEY_MODE: self._mode,
             KEY_LED_DELAY: self.led_delay,
             KEY_BRIGHTNESS: self.brightness,
         }
         if not save_only:
-            data[KEY_STATUS] = self.status
+            data[KEY_STATUS] = self._status
         return data
 
 
+# Shared sentinel returned when no routine is active, compared by identity. Must not be modified.
 OffLightingRoutine = LightingRoutine(
     color_profile.DEFAULT_PROFILE_OFF,
     days=DAYS_ALL,
@@ -470,12 +533,24 @@ OffLightingRoutine = LightingRoutine(
 
 
 class LightingSchedules(Collection):
-    """Singleton for managing reusable lighting schedules."""
+    """Singleton for managing reusable lighting schedules.
+
+    Schedules are applied outside the collection lock, to prevent slow LED updates blocking changes to the collection.
+    Applying schedules is serialized by a separate lock instead, which also guards the applied profiles.
+    """
+
+    # Profile, schedule, and routine last applied to each manager. Schedule is None until first applied, and routine is
+    # also None while the off routine is applied.
+    __schedules_applied__: dict[
+        str, tuple[color_profile.ColorProfile, LightingSchedule | None, LightingRoutine | None]
+    ] = {}
 
-    __schedules_applied__: dict[str, color_profile.ColorProfile] = {}
+    _apply_lock: threading.Lock = threading.Lock()
 
     _collection: dict[str, LightingSchedule] = {}
-    _collection_lock: threading.Condition = threading.Condition()
+    _collection_lock: CollectionRWLock = CollectionRWLock()
+    # Schedules ordered by name, created on first use and cleared whenever schedules are added, removed, or updated.
+    _collection_sorted: list[LightingSchedule] | None = None
     _collection_uri: str = None
 
     collection_help: str = "lighting schedules"
@@ -488,14 +563,12 @@ class LightingSchedules(Collection):
         routine: LightingRoutine,
         profile: color_profile.ColorProfile,
         manager: led_manager.LEDManager,
+        off_profile: color_profile.ColorProfile,
     ) -> None:
         """Apply a lighting schedule."""
+        applied_profile, applied_schedule, applied_routine = cls.__schedules_applied__[schedule.manager]
         # Allow animating if turning on/off, or automatically changing between schedules.
-        if (
-            cls.__schedules_applied__.get(schedule.manager).name == color_profile.DEFAULT_PROFILE_OFF
-            or profile.name == color_profile.DEFAULT_PROFILE_OFF
-            or schedule.mode == MODE_AUTO
-        ):
+        if applied_profile is off_profile or profile is off_profile or schedule.mode == MODE_AUTO:
             led_delay = schedule.led_delay
         else:
             led_delay = None
@@ -508,19 +581,26 @@ class LightingSchedules(Collection):
 
         colors = color_utils.generate_pattern(profile.corrected_colors, len(manager))
         manager.set_brightness(brightness, show=True, save=False)
-        time.sleep(0.25)
-        time.sleep(led_delay or manager.led_delay)
+        # Allow the brightness change to settle, followed by the normal delay between LED updates.
+        time.sleep(0.25 + (led_delay or manager.led_delay))
         manager.set_colors(colors, delay=0 if led_delay is None else max(led_delay, manager.led_delay), show=True)
-        for old_schedule in cls._collection.values():
-            old_schedule.status = STATUS_OFF
-            for old_routine in old_schedule.routines:
-                old_routine.status = STATUS_OFF
-
-        schedule.status = STATUS_ON
-        routine.status = STATUS_ON
+        # The off routine is shared by every manager, so only routines owned by schedules track their status.
+        owned_routine = None if routine is OffLightingRoutine else routine
+        with cls._collection_lock:
+            # Only the schedule previously applied to this manager needs to be turned off.
+            if applied_schedule is not None:
+                applied_schedule.status = STATUS_OFF
+            if applied_routine is not None:
+                applied_routine.status = STATUS_OFF
+            schedule.status = STATUS_ON
+            if owned_routine is not None:
+                owned_routine.status = STATUS_ON
+            cls._collection_json = None
         # Copy the profile so that changes will be detected instead of comparing to self.
-        cls.__schedules_applied__[schedule.manager] = profile.copy()
-        if profile.name == color_profile.DEFAULT_PROFILE_OFF:
+        # The reserved off profile cannot be modified, so it is stored directly.
+        applied_profile = profile if profile is off_profile else profile.copy()
+        cls.__schedules_applied__[schedule.manager] = (applied_profile, schedule, owned_routine)
+        if profile is off_profile:
             manager.status = STATUS_OFF
             logger.info(f"Turned off LEDs on manager {schedule.manager} due to no enabled routines")
         else:
@@ -528,6 +608,7 @@ class LightingSchedules(Collection):
             logger.info(
                 f"Applied {schedule.name} schedule using {routine.profile} profile to manager {schedule.manager} due to matching {routine.days_human} {routine.start_time} - {routine.end_time} routine"
             )
+        led_manager.LEDManagers.invalidate_json()
 
     @classmethod
     def get(cls, key: str) -> LightingSchedule:
@@ -544,21 +625,64 @@ class LightingSchedules(Collection):
         Returns:
             Mapping of routines that should be active by manager ID.
         """
-        with cls._collection_lock:
-            pending = {}
-            for schedule in sorted(cls._collection.values()):
-                pending.setdefault(schedule.manager, (schedule, OffLightingRoutine))
-                active = schedule.active
-                if active != OffLightingRoutine:
-                    pending[schedule.manager] = (schedule, active)
+        # Read the clock once so that every routine is compared against the same time.
+        now_in_seconds, today = _now_snapshot()
+        with cls._collection_lock.read():
+            schedules = cls._collection_sorted
+            if schedules is None:
+                schedules = sorted(cls._collection.values())
+                cls._collection_sorted = schedules
+        pending = {}
+        for schedule in schedules:
+            pending.setdefault(schedule.manager, (schedule, OffLightingRoutine))
+            active = schedule.active_at(now_in_seconds, today)
+            if active is not OffLightingRoutine:
+                pending[schedule.manager] = (schedule, active)
         return pending
 
+    @classmethod
+    def register_many(cls, entries: Iterable[LightingSchedule]) -> None:
+        """Store multiple schedules for concurrent access as a single change, and clear the sorted schedules."""
+        with cls._collection_lock:
+            super().register_many(entries)
+            cls._collection_sorted = None
+
+    @classmethod
+    def remove(cls, key: str) -> LightingSchedule:
+        """Remove a schedule from persistent storage, and clear the sorted schedules."""
+        with cls._collection_lock:
+            schedule = super().remove(key)
+            cls._collection_sorted = None
+        return schedule
+
+    @classmethod
+    def seconds_until_next_boundary(cls, now_in_seconds: int) -> int:
+        """Find how long until the next time any routine may become active or inactive.
+
+        Args:
+            now_in_seconds: Time of day in seconds to measure from.
+
+        Returns:
+            Seconds until the next start, end, or change of day, between 1 and 86400.
+        """
+        # Midnight is always a boundary, because the enabled days are re-evaluated when the day changes.
+        boundaries = {0}
+        with cls._collection_lock.read():
+            for schedule in cls._collection.values():
+                if schedule.mode == MODE_OFF:
+                    continue
+                for routine in schedule.routines:
+                    # End is inclusive, the routine becomes inactive the second after.
+                    boundaries.add(routine.start)
+                    boundaries.add(routine.end + 1)
+        return min((boundary - now_in_seconds - 1) % 86400 + 1 for boundary in boundaries)
+
     @classmethod
     def update(
         cls,
         uuid: str,
         new_values: dict,
-    ) -> dict:
+    ) -> tuple[dict, set[str]]:
         """Update the values of a schedule.
 
         Args:
@@ -566,30 +690,38 @@ class LightingSchedules(Collection):
             new_values: New JSON like attributes to set on the schedule.
 
         Returns:
-            Final schedule configuration with the updated values.
+            Final schedule configuration with the updated values, and the keys of the values that changed.
         """
+        changed = set()
         with cls._collection_lock:
+            cls._collection_json = None
+            cls._collection_sorted = None
             schedule = cls.get(uuid)
             name = get_and_validate(new_values, KEY_NAME, str)
             if name is not None and name != schedule.name:
                 schedule.name = name
+                changed.add(KEY_NAME)
             routines = get_and_validate(new_values, KEY_ROUTINES, list)
             if routines is not None:
                 try:
                     schedule.routines = [LightingRoutine.from_json(routine) for routine in routines]
                 except Exception as error:  # pylint: disable=broad-except
                     raise CollectionValueError("invalid-lighting_schedule-routines") from error
+                changed.add(KEY_ROUTINES)
             mode = get_and_validate(new_values, KEY_MODE, int)
-            if mode is not None:
+            if mode is not None and mode != schedule.mode:
                 schedule.mode = mode
+                changed.add(KEY_MODE)
             led_delay = get_and_validate(new_values, KEY_LED_DELAY, float)
-            if led_delay is not None:
+            if led_delay is not None and led_delay != schedule.led_delay:
                 schedule.led_delay = led_delay
+                changed.add(KEY_LED_DELAY)
             brightness = get_and_validate(new_values, KEY_BRIGHTNESS, float)
-            if brightness is not None:
+            if brightness is not None and brightness != schedule.brightness:
                 schedule.brightness = brightness
+                changed.add(KEY_BRIGHTNESS)
             result = schedule.to_json()
-        return result
+        return result, changed
 
     @classmethod
     def update_profile(cls, old_profile_name: str, new_profile_name: str) -> None:
@@ -604,6 +736,7 @@ class LightingSchedules(Collection):
                 for routine in schedule.routines:
                     if routine.profile == old_profile_name:
                         routine.profile = new_profile_name
+            cls._collection_json = None
 
     @classmethod
     def verify_active_schedules(cls, force: bool = False) -> None:
@@ -612,22 +745,29 @@ class LightingSchedules(Collection):
         Args:
             force: Force the schedule to re-apply in case of changes, even if already active.
         """
-        pending = cls.pending_routines()
-        with cls._collection_lock:
+        with cls._apply_lock:
+            pending = cls.pending_routines()
+            if not pending:
+                return
+            try:
+                off_profile = color_profile.ColorProfiles.get(color_profile.DEFAULT_PROFILE_OFF)
+            except responses.APIError as error:
+                if error.code != 404:
+                    raise error
+                logger.warning(f"Skipping update of LEDs due to missing {color_profile.DEFAULT_PROFILE_OFF} profile")
+                return
             for schedule, routine in sorted(pending.values()):
                 try:
                     manager = led_manager.LEDManagers.get(schedule.manager)
                     if schedule.manager not in cls.__schedules_applied__:
-                        cls.__schedules_applied__[schedule.manager] = color_profile.ColorProfiles.get(
-                            color_profile.DEFAULT_PROFILE_OFF
-                        )
+                        cls.__schedules_applied__[schedule.manager] = (off_profile, None, None)
                 except responses.APIError as error:
                     if error.code != 404:
                         raise error
                     logger.warning(f"Skipping update of LEDs on non-existent manager {schedule.manager}")
                     continue
                 if manager.mode == MODE_OFF:
-                    profile = color_profile.ColorProfiles.get(color_profile.DEFAULT_PROFILE_OFF)
+                    profile = off_profile
                 else:
                     try:
                         profile = color_profile.ColorProfiles.get(routine.profile)
@@ -635,40 +775,57 @@ class LightingSchedules(Collection):
                         if error.code != 404:
                             raise error
                         # Fallback to off, the profile was not found.
-                        profile = color_profile.ColorProfiles.get(color_profile.DEFAULT_PROFILE_OFF)
-                if force or cls.__schedules_applied__.get(schedule.manager) != profile:
-                    cls._apply_schedule(schedule, routine, profile, manager)
+                        profile = off_profile
+                if force or cls.__schedules_applied__[schedule.manager][0] != profile:
+                    cls._apply_schedule(schedule, routine, profile, manager, off_profile)
 
 
 def start_schedule_watchdog() -> None:
-    """Create a watchdog for monitoring the schedules and enabling/disabling them based on their routines."""
+    """Create a watchdog for monitoring the schedules and enabling/disabling them based on their routines.
+
+    The watchdog checks the schedules when a routine may start or end, when woken, and at least once a minute.
+    Changes made through the API apply schedules immediately, or wake the watchdog. Any other changes may take up to
+    a minute to apply.
+    """
     global __WATCHDOG__  # pylint: disable=global-statement
-    global __WATCHDOG_SLEEP__  # pylint: disable=global-statement
-    interval = 5
+    # Maximum time to wait between checks, to pick up changes that were not applied, or did not wake the watchdog.
+    max_interval = 60
+    retry_interval = 5
+    if __WATCHDOG__ is not None and __WATCHDOG_STOP__.is_set():
+        # Wait for a previous watchdog to finish stopping, or it will not be replaced.
+        __WATCHDOG__.join()
     if __WATCHDOG__ is None or not __WATCHDOG__.is_alive():
 
         def _release_the_hound() -> None:
             """Monitor schedules and enable/disable as appropriate."""
             logger.info("Schedule watchdog is running")
+            interval = 0
             while True:
-                if __WATCHDOG_SLEEP__:
-                    global __WATCHDOG__  # pylint: disable=global-statement
-                    __WATCHDOG__ = None
+                __WATCHDOG_WAKE__.wait(interval)
+                __WATCHDOG_WAKE__.clear()
+                if __WATCHDOG_STOP__.is_set():
                     break
                 try:
                     LightingSchedules.verify_active_schedules()
+                    interval = min(LightingSchedules.seconds_until_next_boundary(_now_snapshot()[0]), max_interval)
                 except:  # pylint: disable=bare-except
                     logger.exception("Failed to verify lighting schedules")
-                time.sleep(interval)
+                    interval = retry_interval
             logger.info("Schedule watchdog is sleeping")
 
         # This must be a daemon to ensure that the primary thread does not wait for it.
-        __WATCHDOG_SLEEP__ = False
+        __WATCHDOG_STOP__.clear()
+        __WATCHDOG_WAKE__.clear()
         __WATCHDOG__ = threading.Thread(target=_release_the_hound, daemon=True)
         __WATCHDOG__.start()
 
 
 def stop_schedule_watchdog() -> None:
     """Stop the schedule watchdog to prevent changing the active color profile routines."""
-    global __WATCHDOG_SLEEP__  # pylint: disable=global-statement
-    __WATCHDOG_SLEEP__ = True
+    __WATCHDOG_STOP__.set()
+    __WATCHDOG_WAKE__.set()
+
+
+def wake_schedule_watchdog() -> None:
+    """Request the schedule watchdog check the schedules immediately, instead of waiting for the next check."""
+    __WATCHDOG_WAKE__.set()
@@ -78,6 +78,15 @@ class LEDMicroManager(metaclass=abc.ABCMeta):
                     self.show()
         return changed
 
+    def _set_colors(self, colors: list[Colors | ColorUnion]) -> None:
+        """Set colors starting from the first LED position.
+
+        Alias for index operator on every color. Override if multiple colors can be set in a single operation.
+        Should not call show() to allow optimizing batch calls.
+        """
+        for index, color in enumerate(colors):
+            self[index] = color
+
     @property
     def brightness(self) -> float:
         """Current brightness as a percent between 0.0 and 1.0."""
@@ -154,13 +163,16 @@ class LEDMicroManager(metaclass=abc.ABCMeta):
             with self._lock:
                 self._set_color(index, color, show=show)
         else:
-            if delay:
+            if delay > 0:
+                color = color_utils.parse_color(color)
 
                 def _set_color() -> None:
-                    for led, _ in enumerate(self):
+                    for led in range(len(self)):
                         with self._lock:
-                            self._set_color(led, color, show=True)
-                        time.sleep(delay)
+                            changed = self._set_color(led, color, show=True)
+                        # Only wait after visible changes, LEDs that already match are skipped immediately.
+                        if changed:
+                            time.sleep(delay)
 
                 threading.Thread(target=_set_color, daemon=True).start()
             else:
@@ -182,22 +194,24 @@ class LEDMicroManager(metaclass=abc.ABCMeta):
             show: Whether to show the change immediately, or delay until the next show() is called.
                 Ignored if delay > 0.
         """
-        if delay:
+        if delay > 0:
 
             def _set_color() -> None:
                 for led, led_color in enumerate(colors):
                     with self._lock:
-                        self._set_color(led, led_color, show=True)
-                    time.sleep(delay)
+                        changed = self._set_color(led, led_color, show=True)
+                    # Only wait after visible changes, LEDs that already match are skipped immediately.
+                    if changed:
+                        time.sleep(delay)
 
             threading.Thread(target=_set_color, daemon=True).start()
         else:
             with self._lock:
-                if all(color == colors[0] for color in colors):
+                # Count in a single C level pass, instead of comparing each color with a generator.
+                if colors.count(colors[0]) == len(colors):
                     self.fill(colors[0], show=show)
                 else:
-                    for index, color in enumerate(colors):
-                        self[index] = color
+                    self._set_colors(colors)
                     if show:
                         self.show()
 
@@ -81,6 +81,15 @@ class NeoPixelManager(LEDMicroManager):
         with self._lock:
             self._neo_pixel[index] = color
 
+    def _set_colors(self, colors: list[Colors | ColorUnion]) -> None:
+        """Set colors starting from the first LED position.
+
+        Override of base to convert all colors at once and set them with a single slice assignment.
+        """
+        colors = list(map(color_utils.parse_color, colors))
+        with self._lock:
+            self._neo_pixel[: len(colors)] = colors
+
     @classmethod
     def from_json(cls, data: dict) -> NeoPixelManager:
         """Convert JSON type into manager instance."""
@@ -130,7 +139,9 @@ class NeoPixelManager(LEDMicroManager):
         with self._lock:
             if save:
                 self._brightness = brightness
-            self._neo_pixel.brightness = brightness
+            # Changing the brightness rescales every pixel in the buffer, skip it when the value is already applied.
+            if self._neo_pixel.brightness != brightness:
+                self._neo_pixel.brightness = brightness
             if show:
                 self.show()
 
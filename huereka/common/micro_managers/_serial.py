@@ -76,6 +76,8 @@ class SerialManager(
         super().__init__(brightness=brightness)
         self._ready = False
         self._pending = []
+        # Last brightness level sent to the device, to skip resending unchanged values. None if unknown.
+        self._brightness_level = None
         self._colors = [Colors.BLACK.value for _ in range(led_count)]
         self.strip = strip
         self.pin = pin
@@ -126,6 +128,7 @@ class SerialManager(
 
     def _op_init_strip(self) -> None:
         """Send operation to set up LED strip."""
+        self._brightness_level = None
         self._write(
             OP_INIT_STRIP,
             0,  # Placeholder for LED type.
@@ -141,24 +144,25 @@ class SerialManager(
         self._write(
             OP_FILL_LEDS,
             self.strip,
-            color.red,
-            color.green,
-            color.blue,
+            # Red, green, and blue portions as single bytes.
+            (color & 0xFFFFFF).to_bytes(length=3, byteorder="big", signed=False),
             1 if show else 0,
         )
 
     def _op_reset(self) -> None:
         """Force the remote device to hard reset."""
+        self._brightness_level = None
         self._write(
             OP_RESET,
         )
 
     def _op_set_brightness(self, brightness: float, show: bool = True) -> None:
         """Send operation to set brightness of entire LED strip."""
+        self._brightness_level = math.floor(255 * brightness)
         self._write(
             OP_SET_BRIGHTNESS,
             self.strip,
-            math.floor(255 * brightness),
+            self._brightness_level,
             1 if show else 0,
         )
 
@@ -169,9 +173,8 @@ class SerialManager(
             OP_SET_LED,
             self.strip,
             pos.to_bytes(length=2, byteorder="big", signed=False),
-            color.red,
-            color.green,
-            color.blue,
+            # Red, green, and blue portions as single bytes.
+            (color & 0xFFFFFF).to_bytes(length=3, byteorder="big", signed=False),
             1 if show else 0,
         )
 
@@ -209,6 +212,27 @@ class SerialManager(
                 self._op_set_led(index, color, show=show)
         return changed
 
+    def _set_colors(self, colors: list[Colors | ColorUnion]) -> None:
+        """Set colors starting from the first LED position.
+
+        Override of base to pack the set operations of all changed LEDs into a single serial write.
+        """
+        colors = list(map(color_utils.parse_color, colors))
+        # Same format as _op_set_led(), without showing: magic, op, strip, 2 byte position, 3 byte color, show flag.
+        header = OP_MAGIC + bytes((OP_SET_LED, self.strip))
+        msg = bytearray()
+        with self._lock:
+            current = self._colors
+            for index, color in enumerate(colors):
+                if current[index] != color:
+                    current[index] = color
+                    msg += header
+                    msg += index.to_bytes(length=2, byteorder="big", signed=False)
+                    msg += (color & 0xFFFFFF).to_bytes(length=3, byteorder="big", signed=False)
+                    msg += b"\x00"
+            if msg:
+                self._write(bytes(msg), start=False)
+
     def _write(self, *values: int | bytes, start: bool = True) -> None:
         """Write out a set of unsigned, single byte, values to the serial connection."""
         if not self._ready:
@@ -285,7 +309,11 @@ class SerialManager(
         with self._lock:
             if save:
                 self._brightness = brightness
-            self._op_set_brightness(brightness, show=show)
+            if math.floor(255 * brightness) != self._brightness_level:
+                self._op_set_brightness(brightness, show=show)
+            elif show:
+                # Brightness is already applied, but pending pixel changes are still expected to be shown.
+                self._op_show()
 
     def show(self) -> None:
         """Display all pending pixel changes since last show."""
@@ -0,0 +1,118 @@
+"""Helpers for persisting collections to storage outside of API requests."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+
+from huereka.shared.collections import Collection
+from huereka.shared.collections import CollectionEntry
+
+logger = logging.getLogger(__name__)
+
+# Time in seconds to wait for additional changes before saving, to combine bursts of changes into a single save.
+SAVE_DEBOUNCE = 0.1
+# Maximum time in seconds to delay a save while changes continue to arrive, to prevent them never being saved.
+SAVE_DEBOUNCE_MAX = 1.0
+
+__SAVER__ = None
+__SAVE_REQUESTED__ = threading.Event()
+# Pending collections are stored as dictionary keys to provide an ordered set.
+__SAVES_PENDING__: dict[type[Collection], None] = {}
+__SAVES_PENDING_LOCK__ = threading.Lock()
+__SAVES_LOCK__ = threading.Lock()
+
+
+def flush() -> None:
+    """Save all collections with pending changes immediately.
+
+    Blocks until any save already in progress completes, to guarantee no changes are pending when it returns.
+    """
+    with __SAVES_LOCK__:
+        with __SAVES_PENDING_LOCK__:
+            pending = list(__SAVES_PENDING__)
+            __SAVES_PENDING__.clear()
+        for collection in pending:
+            try:
+                collection.save()
+            except Exception as error:  # pylint: disable=broad-except
+                logger.exception(f"Failed to save {collection.collection_help}", exc_info=error)
+
+
+def commit_register(collection: type[Collection], entry: CollectionEntry) -> None:
+    """Store a new entry and request the collection be saved, as a single locked operation.
+
+    Args:
+        collection: Collection to store the entry in.
+        entry: Previously setup entry to be stored in the collection.
+    """
+    with collection._collection_lock:  # pylint: disable=protected-access
+        collection.register(entry)
+        mark_dirty(collection)
+
+
+def commit_remove(collection: type[Collection], key: str) -> CollectionEntry:
+    """Remove an entry and request the collection be saved, as a single locked operation.
+
+    Args:
+        collection: Collection to remove the entry from.
+        key: ID of the saved entry.
+
+    Returns:
+        The entry removed from the collection.
+    """
+    with collection._collection_lock:  # pylint: disable=protected-access
+        entry = collection.remove(key)
+        mark_dirty(collection)
+    return entry
+
+
+def commit_update(collection: type[Collection], uuid: str, new_values: dict) -> tuple[dict, set[str]]:
+    """Update the values of an entry and request the collection be saved, as a single locked operation.
+
+    Args:
+        collection: Collection containing the entry to update.
+        uuid: ID of the original entry to update.
+        new_values: New attributes to set on the entry.
+
+    Returns:
+        Final configuration with the updated values, and the keys of the values that changed.
+    """
+    with collection._collection_lock:  # pylint: disable=protected-access
+        result, changed = collection.update(uuid, new_values)
+        mark_dirty(collection)
+    return result, changed
+
+
+def mark_dirty(collection: type[Collection]) -> None:
+    """Request a collection be saved in the background, combined with any other requests received before the save.
+
+    Args:
+        collection: Collection with changes that need to be persisted.
+    """
+    global __SAVER__  # pylint: disable=global-statement
+    with __SAVES_PENDING_LOCK__:
+        __SAVES_PENDING__[collection] = None
+        if __SAVER__ is None or not __SAVER__.is_alive():
+
+            def _save_pending() -> None:
+                """Wait for save requests and persist the pending collections."""
+                while True:
+                    __SAVE_REQUESTED__.wait()
+                    __SAVE_REQUESTED__.clear()
+                    # Wait until no more changes are requested for the debounce period, or the maximum delay passes.
+                    deadline = time.monotonic() + SAVE_DEBOUNCE_MAX
+                    while __SAVE_REQUESTED__.wait(SAVE_DEBOUNCE) and time.monotonic() < deadline:
+                        __SAVE_REQUESTED__.clear()
+                    flush()
+
+            # This must be a daemon to ensure that the primary thread does not wait for it. Pending saves are
+            # flushed on exit instead.
+            __SAVER__ = threading.Thread(target=_save_pending, daemon=True)
+            __SAVER__.start()
+    __SAVE_REQUESTED__.set()
+
+
+atexit.register(flush)
@@ -12,6 +12,8 @@ from flask import Flask
 
 from huereka.api.v1 import api as v1_api
 from huereka.common import config_utils
+from huereka.common import flask_utils
+from huereka.common import persistence
 from huereka.common.color_profile import ColorProfiles
 from huereka.common.colors import Colors
 from huereka.common.led_manager import LEDManagers
@@ -20,6 +22,7 @@ from huereka.common.lighting_schedule import start_schedule_watchdog
 from huereka.shared import responses
 
 app = Flask(__name__)
+app.json = flask_utils.ORJSONProvider(app)
 app.secret_key = config_utils.SECRET_KEY
 app.register_blueprint(v1_api, url_prefix="/api/v1")
 logger = logging.getLogger(__name__)
@@ -46,13 +49,13 @@ def handle_not_allowed(unused_error: Exception) -> tuple:
 @app.route("/health", methods=["GET"])
 def health() -> tuple:
     """Basic health check to ensure server is online and responding."""
-    return responses.ok()
+    return flask_utils.ok()
 
 
 @app.route("/api", methods=["GET"])
 def versions() -> tuple:
     """Provide the API versions available."""
-    return responses.ok(
+    return flask_utils.ok(
         [
             "v1",
         ]
@@ -162,6 +165,8 @@ def main() -> None:
             ssl_context=(args.cert, args.key) if args.key and args.cert else None,
         )
     finally:
+        # Save pending changes before teardown, which removes all managers from the collection.
+        persistence.flush()
         LEDManagers.teardown()
 
 
@@ -14,15 +14,29 @@ import pathlib
 from types import TracebackType
 from typing import Any
 from typing import Callable
+from typing import Iterable
 
 from huereka.shared import environments
 from huereka.shared import responses
 
+try:
+    import orjson
+except ImportError:
+    # Optional for faster loads and saves, and not available in MicroPython.
+    orjson = None  # pylint: disable=invalid-name
+
 logger = logging.getLogger(__name__)
 
 KEY_ID = "id"
 KEY_NAME = "name"
 
+# Durable writes and atomic replacement of existing files are not available in all environments, such as MicroPython.
+_fsync = getattr(os, "fsync", None)
+_replace = getattr(os, "replace", os.rename)
+
+# API style names of collections, by class, to prevent rebuilding them on every error.
+_api_names: dict[type, str] = {}
+
 
 class Collection(abc.ABC):
     """Base singleton class for managing reusable collection entries."""
@@ -31,12 +45,18 @@ class Collection(abc.ABC):
 
     # Base collection mapping. Should be replaced with: {}
     _collection: dict[str, CollectionEntry] = abc.abstractproperty(dict)
-    # Shared lock across threads. Should be replaced with: threading.Condition() or threading.Lock() on systems where
-    # multithreading is used, or DisabledCollectionLock() on systems where multithreading is not supported or used.
-    _collection_lock: Any = abc.abstractproperty()
+    # Shared lock across threads. Should be replaced with: CollectionRWLock() on systems where multithreading is used,
+    # or DisabledCollectionLock() on systems where multithreading is not supported or used.
+    # Entering the lock directly acquires exclusive access; use read() for shared access that does not modify entries.
+    _collection_lock: CollectionRWLock | DisabledCollectionLock = abc.abstractproperty()
     # Location where the collection is stored. Should be replaced with: None
     # First load will set the URI for all future actions.
     _collection_uri: str = abc.abstractproperty(str)
+    # Whether the parent directory of the URI is known to exist, to prevent recreating it on every save.
+    _collection_uri_dir_ready: bool = False
+    # Cached JSON compatible entries, by save_only value, to prevent rebuilding them when nothing has changed.
+    # Cleared on every change to the collection; set per class on first use.
+    _collection_json: dict[bool, list[dict]] | None = None
 
     # Text used when displaying helper/logging messages. e.g. 'user documents'
     collection_help: str = abc.abstractproperty(str)
@@ -46,7 +66,11 @@ class Collection(abc.ABC):
     @classmethod
     def collection_help_api_name(cls) -> str:
         """Provide a consistent, machine/API style, version of the collection help."""
-        return cls.collection_help.lower().replace(" ", "_")
+        api_name = _api_names.get(cls)
+        if api_name is None:
+            api_name = cls.collection_help.lower().replace(" ", "_")
+            _api_names[cls] = api_name
+        return api_name
 
     @classmethod
     def get(cls, key: str) -> CollectionEntry:
@@ -63,7 +87,8 @@ class Collection(abc.ABC):
             APIError if the entry is not found in persistent storage.
         """
         entry = cls._collection.get(key)
-        if not entry:
+        # Check explicitly for None, entries may be falsy, such as when they define a length.
+        if entry is None:
             raise responses.APIError(f"missing-{cls.collection_help_api_name()}", key, code=404)
         return entry
 
@@ -86,39 +111,86 @@ class Collection(abc.ABC):
             loaded_data = data
         generated = []
         errors = []
-        for index, entry_config in enumerate(loaded_data):
-            if not cls.validate_entry(entry_config, index):
-                continue
-            try:
-                entry = cls.entry_cls.from_json(entry_config)
-                cls.register(entry)
+        # Entries are registered together after all are setup, to only update the collection once.
+        loaded = {}
+        # Hold the lock for all entries so that readers never see a partially loaded collection.
+        with cls._collection_lock:
+            for index, entry_config in enumerate(loaded_data):
+                if not cls.validate_entry(entry_config, index, pending=loaded):
+                    continue
+                try:
+                    entry = cls.entry_cls.from_json(entry_config)
+                    # IDs generated during setup are not validated above, check before the batch is registered.
+                    cls._check_unique(entry, loaded)
+                except Exception as error:  # pylint: disable=broad-except
+                    errors.append((index, error))
+                    logger.exception(f"Skipping invalid {cls.collection_help} setup at index {index}", exc_info=error)
+                    continue
+                cls._add_pending(entry, loaded)
                 if not entry_config.get(KEY_ID):
                     generated.append(entry)
-            except Exception as error:  # pylint: disable=broad-except
-                errors.append((index, error))
-                logger.exception(f"Skipping invalid {cls.collection_help} setup at index {index}", exc_info=error)
+            cls.register_many(loaded.values())
         cls.post_load()
         return generated, errors
 
+    @classmethod
+    def _add_pending(cls, entry: CollectionEntry, pending: dict[str, CollectionEntry]) -> None:
+        """Hold an entry that is set up during load until all entries are registered together.
+
+        Args:
+            entry: Entry to hold.
+            pending: Entries waiting to be stored, by ID.
+        """
+        pending[entry.uuid] = entry
+
+    @classmethod
+    def _check_unique(cls, entry: CollectionEntry, pending: dict[str, CollectionEntry]) -> None:
+        """Confirm an entry does not use the ID of a stored entry, or of an entry waiting to be stored.
+
+        Duplicate IDs in the source are skipped by validation. This only catches IDs that are not known until setup,
+        such as generated IDs, or IDs setup derives from other values.
+
+        Args:
+            entry: Entry to check.
+            pending: Entries waiting to be stored, by ID.
+
+        Raises:
+            APIError if the ID is already in use.
+        """
+        uuid = entry.uuid
+        if uuid in cls._collection or uuid in pending:
+            raise responses.APIError(f"duplicate-{cls.collection_help_api_name()}", uuid, code=422)
+
     @classmethod
     def _load_str(cls, data: str | list[dict]) -> list | None:
         """Load collection configuration from a string."""
         loaded_data = None
-        if data.startswith("["):
+        # Inline JSON and file paths are mutually exclusive, so the first character selects the source in most cases.
+        first = data[:1]
+        if first == "[":
             try:
-                loaded_data = json.loads(data)
+                loaded_data = orjson.loads(data) if orjson is not None else json.loads(data)
             except Exception as error:  # pylint: disable=broad-except
                 logger.exception(f"Failed to load {cls.collection_help} from text", exc_info=error)
-        elif data.startswith("/") or data.startswith("file://"):
+        elif first == "/" or data.startswith("file://"):
             cls._collection_uri = data
+            cls._collection_uri_dir_ready = False
             data = data.replace("file://", "")
             try:
-                with open(data, "rt", encoding="utf-8") as file_in:
-                    try:
-                        loaded_data = json.load(file_in)
-                        logger.info(f"Loaded {len(loaded_data)} {cls.collection_help} from {cls._collection_uri}")
-                    except Exception as error:  # pylint: disable=broad-except
-                        logger.exception(f"Failed to load {cls.collection_help} from local file {data}", exc_info=error)
+                if orjson is not None:
+                    # Read raw bytes, orjson parses UTF-8 directly without decoding to text first.
+                    with open(data, "rb") as file_in:
+                        raw_data = file_in.read()
+                    loads = orjson.loads
+                else:
+                    with open(data, "rt", encoding="utf-8") as file_in:
+                        raw_data = file_in.read()
+                    loads = json.loads
+                try:
+                    loaded_data = loads(raw_data)
+                    logger.info(f"Loaded {len(loaded_data)} {cls.collection_help} from {cls._collection_uri}")
+                except Exception as error:  # pylint: disable=broad-except
+                    logger.exception(f"Failed to load {cls.collection_help} from local file {data}", exc_info=error)
             except OSError as error:
                 if error.errno == 2:
                     logger.warning(f"Skipping {cls.collection_help} load, file not found {data}")
@@ -138,12 +210,39 @@ class Collection(abc.ABC):
         Args:
             entry: Previously setup entry to be stored in the cache and used during concurrent calls.
         """
+        cls.register_many((entry,))
+        logger.debug(f"Registered {cls.collection_help} {entry.uuid} {entry.name}")
+
+    @classmethod
+    def register_many(cls, entries: Iterable[CollectionEntry]) -> None:
+        """Store multiple entries for concurrent access as a single change.
+
+        Args:
+            entries: Previously setup entries to be stored in the cache and used during concurrent calls.
+
+        Raises:
+            APIError if any entry is already stored, or provided more than once. No entries are stored on error.
+        """
+        new_entries = {}
         with cls._collection_lock:
-            uuid = entry.uuid
-            if uuid in cls._collection:
-                raise responses.APIError(f"duplicate-{cls.collection_help_api_name()}", uuid, code=422)
-            cls._collection[uuid] = entry
-            logger.debug(f"Registered {cls.collection_help} {entry.uuid} {entry.name}")
+            collection = cls._collection
+            for entry in entries:
+                uuid = entry.uuid
+                if uuid in collection or uuid in new_entries:
+                    raise responses.APIError(f"duplicate-{cls.collection_help_api_name()}", uuid, code=422)
+                new_entries[uuid] = entry
+            if not new_entries:
+                return
+            collection.update(new_entries)
+            cls._collection_json = None
+        if len(new_entries) > 1:
+            logger.debug(f"Registered {len(new_entries)} {cls.collection_help}")
+
+    @classmethod
+    def invalidate_json(cls) -> None:
+        """Clear the cached JSON entries so that changes made to entries outside the collection are reflected."""
+        with cls._collection_lock:
+            cls._collection_json = None
 
     @classmethod
     def remove(cls, key: str) -> CollectionEntry:
@@ -156,34 +255,52 @@ class Collection(abc.ABC):
             APIError if the entry does not exist and cannot be removed.
         """
         with cls._collection_lock:
-            if key not in cls._collection:
+            entry = cls._collection.pop(key, None)
+            if entry is None:
                 raise responses.APIError(f"missing-{cls.collection_help_api_name()}", key, code=404)
-            return cls._collection.pop(key)
+            cls._collection_json = None
+        return entry
 
     @classmethod
     def save(cls) -> None:
-        """Persist the current entries to storage."""
+        """Persist the current entries to storage.
+
+        Only collecting the entries blocks changes to the collection, serializing and writing are done without the lock.
+        Callers must not save the same collection from multiple threads at once, such as by using a single saver.
+        """
         if cls._collection_uri is not None:
             uri = cls._collection_uri
             if uri.startswith("/") or uri.startswith("file://"):
                 uri = uri.replace("file://", "")
 
-                path = pathlib.Path(uri)
-                path.parent.mkdir(parents=True, exist_ok=True)
-
-                with cls._collection_lock:
-                    # Write to a temporary file, and then move to expected file, so that if for any reason
-                    # it is interrupted, the original remains intact and the user can decide which to load.
-                    tmp_path = f"{uri}.tmp"
-                    with open(tmp_path, "w+", encoding="utf-8") as file_out:
-                        # Use pretty-print in standard environments to simplify manual reviews of collections,
-                        # since their collections are typically large. MicroPython does not support pretty-printing.
-                        if environments.is_micro_python():
-                            json.dump(cls.to_json(save_only=True), file_out)
-                        else:
-                            json.dump(cls.to_json(save_only=True), file_out, indent=2)
-                    os.rename(tmp_path, uri)
-                    logger.info(f"Saved {cls.collection_help} to {uri}")
+                if not cls._collection_uri_dir_ready:
+                    pathlib.Path(uri).parent.mkdir(parents=True, exist_ok=True)
+                    cls._collection_uri_dir_ready = True
+
+                # The cached entries are replaced instead of modified on change, and are safe to serialize unlocked.
+                entries = cls.to_json(save_only=True)
+                # Serialize the entire collection before writing so that it is sent to the file in one buffered
+                # write, instead of the many small writes performed when dumping directly to the file.
+                # Use pretty-print in standard environments to simplify manual reviews of collections,
+                # since their collections are typically large. MicroPython does not support pretty-printing.
+                if orjson is not None:
+                    data = orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+                elif environments.is_micro_python():
+                    data = json.dumps(entries).encode("utf-8")
+                else:
+                    data = json.dumps(entries, indent=2).encode("utf-8")
+
+                # Write to a temporary file, and then move to expected file, so that if for any reason
+                # it is interrupted, the original remains intact and the user can decide which to load.
+                tmp_path = f"{uri}.tmp"
+                with open(tmp_path, "wb") as file_out:
+                    file_out.write(data)
+                    if _fsync is not None:
+                        # Ensure the data is on disk before the original is replaced.
+                        file_out.flush()
+                        _fsync(file_out.fileno())
+                _replace(tmp_path, uri)
+                logger.info(f"Saved {cls.collection_help} to {uri}")
 
     @classmethod
     def teardown(cls) -> None:
@@ -197,17 +314,23 @@ class Collection(abc.ABC):
             save_only: Whether to only include values that are meant to be saved.
 
         Returns:
-            List of entries as basic objects.
+            List of entries as basic objects. Shared between callers until the collection changes, do not modify.
         """
-        with cls._collection_lock:
-            return [entry.to_json(save_only=save_only) for entry in cls._collection.values()]
+        with cls._collection_lock.read():
+            if cls._collection_json is None:
+                cls._collection_json = {}
+            entries = cls._collection_json.get(save_only)
+            if entries is None:
+                entries = [entry.to_json(save_only=save_only) for entry in cls._collection.values()]
+                cls._collection_json[save_only] = entries
+            return entries
 
     @classmethod
     def update(
         cls,
         uuid: str,
         new_values: dict,
-    ) -> dict:
+    ) -> tuple[dict, set[str]]:
         """Update the values of an entry.
 
         Args:
@@ -215,9 +338,10 @@ class Collection(abc.ABC):
             new_values: New attributes to set on the entry.
 
         Returns:
-            Final configuration with the updated values.
+            Final configuration with the updated values, and the keys of the values that changed.
         """
         with cls._collection_lock:
+            cls._collection_json = None
             result = cls.get(uuid).update(new_values)
         return result
 
@@ -226,18 +350,21 @@ class Collection(abc.ABC):
         cls,
         data: dict,
         index: int,
+        pending: dict[str, CollectionEntry] | None = None,
     ) -> bool:
         """Additional confirmation of entry values before load.
 
         Args:
             data: Original data to check for valid values.
             index: Position of the entry in the source where it is being loaded from.
+            pending: Entries from the same source that are set up, but not stored yet, by ID.
 
         Returns:
             True if the load should continue, False if it should be skipped.
         """
         uuid = data.get(KEY_ID)
-        if uuid in cls._collection:
+        # Entries from the same source are not stored yet, check them as well to skip duplicates before setup.
+        if uuid in cls._collection or (pending is not None and uuid in pending):
             logger.warning(f"Skipping duplicate {cls.collection_help} setup at index {index} using uuid {uuid}")
             return False
         return True
@@ -246,6 +373,8 @@ class Collection(abc.ABC):
 class CollectionEntry(abc.ABC):
     """Base for loading and storing collection entries."""
 
+    __slots__ = ("_hash", "name", "uuid")
+
     def __init__(self, uuid: str | None = None, name: str | None = None) -> None:
         """Set up the base collection entry values.
 
@@ -255,10 +384,12 @@ class CollectionEntry(abc.ABC):
         """
         self.uuid = uuid if uuid else str(uuid4())
         self.name = name or f"{self.__class__.__name__}_{self.uuid}"
+        # The ID does not change after creation, store the hash to prevent recalculating it on every use.
+        self._hash = hash(self.uuid)
 
     def __hash__(self) -> int:
         """Make the collection hashable."""
-        return hash(self.uuid)
+        return self._hash
 
     def __gt__(self, other: Any) -> bool:
         """Make the collection comparable for greater than operations by name."""
@@ -300,14 +431,14 @@ class CollectionEntry(abc.ABC):
     def update(
         self,
         new_values: dict,
-    ) -> dict:
+    ) -> tuple[dict, set[str]]:
         """Update the values of an entry.
 
         Args:
             new_values: New attributes to set on the entry.
 
         Returns:
-            Final configuration with the updated values.
+            Final configuration with the updated values, and the keys of the values that changed.
 
         Raises:
             CollectionValueError if the class does not allow updates.
@@ -323,10 +454,102 @@ class CollectionValueError(responses.APIError):
         super().__init__(error, data, code=code)
 
 
+class CollectionRWLock:
+    """Reader-writer lock to allow concurrent reads of a collection, while changes are made exclusively.
+
+    Entering the lock context directly acquires the write lock, and read() provides a context for the read lock.
+    The write lock is reentrant, and reads requested by the thread holding the write lock are granted immediately.
+    Reads are preferred over writes; a thread holding a read lock must not request the write lock.
+    Requires threading; use DisabledCollectionLock on systems where multithreading is not supported or used.
+    """
+
+    def __init__(self) -> None:
+        """Set up the lock state."""
+        import threading  # Threading must be opt-in for MicroPython. pylint: disable=import-outside-toplevel
+
+        self._condition = threading.Condition(threading.Lock())
+        self._get_ident = threading.get_ident
+        self._read_lock = _CollectionReadLock(self)
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+
+    def __enter__(self) -> CollectionRWLock:
+        """Acquire the write lock when lock context is entered."""
+        self.acquire_write()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException], exc_value: BaseException, traceback: TracebackType) -> None:
+        """Release the write lock when lock context is exited."""
+        self.release_write()
+
+    def acquire_read(self) -> None:
+        """Wait until no other thread holds the write lock, and then acquire a read lock."""
+        ident = self._get_ident()
+        with self._condition:
+            if self._writer == ident:
+                self._writer_depth += 1
+                return
+            while self._writer is not None:
+                self._condition.wait()
+            self._readers += 1
+
+    def acquire_write(self) -> None:
+        """Wait until no other thread holds a read or write lock, and then acquire the write lock."""
+        ident = self._get_ident()
+        with self._condition:
+            if self._writer == ident:
+                self._writer_depth += 1
+                return
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._writer = ident
+            self._writer_depth = 1
+
+    def read(self) -> _CollectionReadLock:
+        """Provide a context to hold a read lock within."""
+        return self._read_lock
+
+    def release_read(self) -> None:
+        """Release a read lock previously acquired by the current thread."""
+        with self._condition:
+            if self._writer == self._get_ident():
+                self._writer_depth -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def release_write(self) -> None:
+        """Release the write lock previously acquired by the current thread."""
+        with self._condition:
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._condition.notify_all()
+
+
+class _CollectionReadLock:
+    """Context for holding the read lock of a CollectionRWLock."""
+
+    def __init__(self, lock: CollectionRWLock) -> None:
+        """Set up the context for a specific lock."""
+        self._lock = lock
+
+    def __enter__(self) -> _CollectionReadLock:
+        """Acquire the read lock when lock context is entered."""
+        self._lock.acquire_read()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException], exc_value: BaseException, traceback: TracebackType) -> None:
+        """Release the read lock when lock context is exited."""
+        self._lock.release_read()
+
+
 class DisabledCollectionLock:
     """Simulated lock object without locking capabilities to allow collection usage in various environments.
 
-    Prefer to use threading.Lock where possible. Using this will remove all multithreading safety from the object,
+    Prefer to use CollectionRWLock where possible. Using this will remove all multithreading safety from the object,
     and require access to be manually protected by callers.
     """
 
@@ -337,6 +560,10 @@ class DisabledCollectionLock:
     def __exit__(self, exc_type: type[BaseException], exc_value: BaseException, traceback: TracebackType) -> None:
         """Placeholder for exit actions when lock context is exited."""
 
+    def read(self) -> DisabledCollectionLock:
+        """Placeholder to return this instance as the read lock context."""
+        return self
+
 
 def get_and_validate(  # Allow complex combinations to validate values consistently. pylint: disable=too-many-arguments
     data: dict,
@@ -369,9 +596,9 @@ def get_and_validate(  # Allow complex combinations to validate values consisten
         CollectionValueError if the data fails to meet all the required criteria.
     """
     value = data.get(key, default)
-    if value is None and nullable:
-        return value
     if value is None:
+        if nullable:
+            return value
         raise CollectionValueError(
             "not-nullable",
             data={